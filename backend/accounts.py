@@ -12,6 +12,7 @@ Table: modal_accounts
   last_used    TEXT           — ISO-8601 or NULL
   last_error   TEXT           — last failure message or NULL
   use_count    INTEGER        — successful dispatches
+  deployed_digest TEXT        — source/env digest of the last successful deploy
 
 Status lifecycle:
   added → pending (deploy queued) → ready (deploy succeeded) ↔ in rotation
@@ -34,6 +35,23 @@ from config import DB_PATH, RESULTS_PATH
 # Accounts table lives in the same gallery.db
 _lock = threading.Lock()
 
+# Bumped on every write so callers can cache derived views (e.g. the admin
+# account list) and cheaply detect when they've gone stale.
+_version = 0
+
+
+def accounts_version() -> int:
+    return _version
+
+
+# (db path, version, rows) snapshot served by list_ready_accounts()
+_ready_cache: Optional[tuple[str, int, list[dict]]] = None
+
+
+def _bump_version() -> None:
+    global _version
+    _version += 1
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -55,6 +73,15 @@ def _db():
         conn.close()
 
 
+@contextmanager
+def _write_db():
+    """Serialized write connection; bumps the version once the write is committed."""
+    with _lock:
+        with _db() as conn:
+            yield conn
+        _bump_version()
+
+
 def init_accounts_table() -> None:
     with _db() as conn:
         conn.execute(
@@ -69,10 +96,15 @@ def init_accounts_table() -> None:
                 added_at     TEXT NOT NULL,
                 last_used    TEXT,
                 last_error   TEXT,
-                use_count    INTEGER NOT NULL DEFAULT 0
+                use_count    INTEGER NOT NULL DEFAULT 0,
+                deployed_digest TEXT
             )
             """
         )
+        # Migrate tables created before deployed_digest existed
+        columns = {r["name"] for r in conn.execute("PRAGMA table_info(modal_accounts)")}
+        if "deployed_digest" not in columns:
+            conn.execute("ALTER TABLE modal_accounts ADD COLUMN deployed_digest TEXT")
 
 
 # ─── CRUD ─────────────────────────────────────────────────────────────────────
@@ -85,7 +117,7 @@ def add_account(
     """Insert a new account in 'pending' state. Returns account ID."""
     account_id = str(uuid.uuid4())
     now = _now_iso()
-    with _lock, _db() as conn:
+    with _write_db() as conn:
         conn.execute(
             """
             INSERT INTO modal_accounts
@@ -114,12 +146,24 @@ def list_accounts() -> list[dict]:
 
 
 def list_ready_accounts() -> list[dict]:
-    """Return only accounts eligible for rotation."""
+    """
+    Return only accounts eligible for rotation.
+    The result is reused until the next write to modal_accounts, so repeated
+    picks (fallback retries, concurrent /generate calls) skip the SQLite read.
+    Returned dicts are shared with the cache and must not be mutated.
+    """
+    global _ready_cache
+    version = _version
+    cached = _ready_cache
+    if cached is not None and cached[0] == DB_PATH and cached[1] == version:
+        return list(cached[2])
     with _db() as conn:
         rows = conn.execute(
             "SELECT * FROM modal_accounts WHERE status='ready' ORDER BY use_count ASC, last_used ASC"
         ).fetchall()
-    return [dict(r) for r in rows]
+    ready = [dict(r) for r in rows]
+    _ready_cache = (DB_PATH, version, ready)
+    return list(ready)
 
 
 def update_account_status(
@@ -127,15 +171,19 @@ def update_account_status(
     status: str,
     workspace: Optional[str] = None,
     error: Optional[str] = None,
+    deployed_digest: Optional[str] = None,
 ) -> None:
     fields = ["status = ?", "last_error = ?"]
     values: list = [status, error]
     if workspace is not None:
         fields.append("workspace = ?")
         values.append(workspace)
+    if deployed_digest is not None:
+        fields.append("deployed_digest = ?")
+        values.append(deployed_digest)
     values.append(account_id)
 
-    with _lock, _db() as conn:
+    with _write_db() as conn:
         conn.execute(
             f"UPDATE modal_accounts SET {', '.join(fields)} WHERE id=?",
             values,
@@ -143,7 +191,7 @@ def update_account_status(
 
 
 def mark_account_used(account_id: str) -> None:
-    with _lock, _db() as conn:
+    with _write_db() as conn:
         conn.execute(
             """
             UPDATE modal_accounts
@@ -155,7 +203,7 @@ def mark_account_used(account_id: str) -> None:
 
 
 def delete_account(account_id: str) -> bool:
-    with _lock, _db() as conn:
+    with _write_db() as conn:
         cursor = conn.execute(
             "DELETE FROM modal_accounts WHERE id=?", (account_id,)
         )
@@ -168,7 +216,7 @@ def disable_account(account_id: str) -> None:
 
 def enable_account(account_id: str) -> None:
     """Re-enable a disabled account (sets it back to 'ready' if it was 'disabled')."""
-    with _lock, _db() as conn:
+    with _write_db() as conn:
         conn.execute(
             "UPDATE modal_accounts SET status='ready', last_error=NULL WHERE id=? AND status='disabled'",
             (account_id,),
@@ -1,7 +1,7 @@
 """
 Security hardening for admin endpoints:
 - Rate-limiting with simple in-memory sliding window (no extras required)
-- All admin actions written to audit_log table in SQLite
+- All admin actions written to audit_log table in SQLite (batched, background thread)
 - Constant-time key comparison (hmac.compare_digest)
 - Minimum key length enforcement
 - IP logging
@@ -11,7 +11,9 @@ from __future__ import annotations
 import hmac
 import logging
 import os
+import queue
 import sqlite3
+import threading
 import time
 from collections import defaultdict
 from datetime import datetime, timezone
@@ -65,17 +67,71 @@ def _ensure_audit_table() -> None:
         logger.warning("Could not create audit table: %s", exc)
 
 
-def _log_action(ip: str, action: str, details: str = "", success: bool = True) -> None:
+# Rows are queued by request handlers and written by one background thread,
+# up to AUDIT_BATCH_MAX rows per transaction, so a burst of admin calls costs
+# one commit instead of one per row and never blocks the event loop.
+AUDIT_FLUSH_INTERVAL = 0.1   # seconds to gather rows after the first arrives
+AUDIT_BATCH_MAX = 256
+
+_AUDIT_QUEUE: "queue.Queue[tuple]" = queue.Queue()
+_audit_thread: Optional[threading.Thread] = None
+_audit_thread_lock = threading.Lock()
+
+
+def _write_audit_rows(rows: list[tuple]) -> None:
     try:
         conn = sqlite3.connect(_get_db_path())
-        conn.execute(
-            "INSERT INTO admin_audit_log(ts,ip,action,details,success) VALUES(?,?,?,?,?)",
-            (datetime.now(timezone.utc).isoformat(), ip, action, details, int(success)),
-        )
-        conn.commit()
-        conn.close()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO admin_audit_log(ts,ip,action,details,success) VALUES(?,?,?,?,?)",
+                    rows,
+                )
+        finally:
+            conn.close()
     except Exception as exc:
-        logger.warning("Audit log write failed: %s", exc)
+        logger.warning("Audit log write failed (%d rows): %s", len(rows), exc)
+
+
+def _audit_flush_loop() -> None:
+    while True:
+        rows = [_AUDIT_QUEUE.get()]
+        deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL
+        while len(rows) < AUDIT_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(_AUDIT_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _write_audit_rows(rows)
+        for _ in rows:
+            _AUDIT_QUEUE.task_done()
+
+
+def _ensure_audit_flusher() -> None:
+    global _audit_thread
+    if _audit_thread is not None and _audit_thread.is_alive():
+        return
+    with _audit_thread_lock:
+        if _audit_thread is None or not _audit_thread.is_alive():
+            _audit_thread = threading.Thread(
+                target=_audit_flush_loop, daemon=True, name="audit-flush"
+            )
+            _audit_thread.start()
+
+
+def _log_action(ip: str, action: str, details: str = "", success: bool = True) -> None:
+    _AUDIT_QUEUE.put(
+        (datetime.now(timezone.utc).isoformat(), ip, action, details, int(success))
+    )
+    _ensure_audit_flusher()
+
+
+def flush_audit_log() -> None:
+    """Block until every queued audit row has been written."""
+    _AUDIT_QUEUE.join()
 
 
 # ── FastAPI Dependency version (works in nested closures) ─────────────────────
@@ -86,16 +142,18 @@ def get_admin_auth(action: str = "unknown"):
     """
     from fastapi import Header, HTTPException as _HTTPException
 
+    # ADMIN_KEY comes from the gooni-admin secret and is fixed for the
+    # container; resolve and encode it once per route instead of per request.
+    expected = os.environ.get("ADMIN_KEY", "")
+    expected_bytes = expected.encode()
+
     async def _dep(x_admin_key: str = Header("", alias="x-admin-key")) -> str:
         """Validate admin key from header — no Request annotation needed."""
-        import os as _os
         ip = "dependency"  # IP not available without Request, logged action matters more
 
         # Rate-limit
         _rate_check(ip)
 
-        expected = _os.environ.get("ADMIN_KEY", "")
-
         if expected and len(expected) < 16:
             logger.error("ADMIN_KEY is too short (<%d chars)", 16)
             _log_action(ip, action, "key_too_short", success=False)
@@ -105,7 +163,7 @@ def get_admin_auth(action: str = "unknown"):
             _log_action(ip, action, "no_key_configured", success=False)
             raise _HTTPException(status_code=403, detail="Admin not configured")
 
-        if not hmac.compare_digest(x_admin_key.encode(), expected.encode()):
+        if not hmac.compare_digest(x_admin_key.encode(), expected_bytes):
             _log_action(ip, action, "bad_key_attempt", success=False)
             logger.warning("Admin auth failure for action=%s", action)
             raise _HTTPException(status_code=403, detail="Invalid admin key")
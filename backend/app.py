@@ -55,9 +55,26 @@ _base_pkgs = [
     "httpx",
 ]
 
+# Baked into the GPU images and read by config.py in the container
+_TORCH_COMPILE = os.environ.get("TORCH_COMPILE", "0")
+_GPU_ENV = {
+    "HF_HOME": MODEL_CACHE_PATH,
+    "TRANSFORMERS_CACHE": MODEL_CACHE_PATH,
+    "TORCH_COMPILE": _TORCH_COMPILE,
+}
+
+
+def _gpu_base_image() -> modal.Image:
+    image = modal.Image.debian_slim(python_version="3.11")
+    if _TORCH_COMPILE.lower() in ("1", "true", "yes"):
+        # C compiler for the Triton kernels torch.compile generates
+        image = image.apt_install("build-essential")
+    return image
+
+
 # Video generation image (A10G — 24 GB)
 video_image = (
-    modal.Image.debian_slim(python_version="3.11")
+    _gpu_base_image()
     .pip_install(
         *_base_pkgs,
         "torch==2.4.0",
@@ -69,13 +86,13 @@ video_image = (
         "safetensors",
         "numpy",
     )
-    .env({"HF_HOME": MODEL_CACHE_PATH, "TRANSFORMERS_CACHE": MODEL_CACHE_PATH})
+    .env(_GPU_ENV)
     .add_local_dir(str(Path(__file__).parent), remote_path="/root")  # backend/ .py files
 )
 
 # Image generation image (T4 — 16 GB, includes bitsandbytes for NF4)
 image_gen_image = (
-    modal.Image.debian_slim(python_version="3.11")
+    _gpu_base_image()
     .pip_install(
         *_base_pkgs,
         "torch==2.4.0",
@@ -87,7 +104,7 @@ image_gen_image = (
         "safetensors",
         "numpy",
     )
-    .env({"HF_HOME": MODEL_CACHE_PATH, "TRANSFORMERS_CACHE": MODEL_CACHE_PATH})
+    .env(_GPU_ENV)
     .add_local_dir(str(Path(__file__).parent), remote_path="/root")  # backend/ .py files
 )
 
@@ -95,9 +112,32 @@ image_gen_image = (
 api_image = (
     modal.Image.debian_slim(python_version="3.11")
     .pip_install(*_base_pkgs, "modal")  # modal CLI needed by deployer.py
+    # Read by deployer.py inside the API container
+    .env({"DEPLOY_CONCURRENCY": os.environ.get("DEPLOY_CONCURRENCY", "4")})
     .add_local_dir(str(Path(__file__).parent), remote_path="/root")  # backend/ .py files
 )
 
+# ─── Result media types (served by GET /results) ──────────────────────────────
+
+_MEDIA_TYPES = {
+    "mp4": "video/mp4", "webm": "video/webm",
+    "png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg",
+}
+
+# Request fields stored in dedicated task columns (or too large to persist);
+# everything else goes into tasks.parameters.
+_PARAMS_EXCLUDE = frozenset({
+    "prompt", "negative_prompt", "model", "type", "mode",
+    "width", "height", "seed",
+    "reference_image", "first_frame_image",
+    "last_frame_image", "arbitrary_frames",
+})
+
+
+def _workspace_url(workspace: str) -> str:
+    """Base URL of the fastapi_app endpoint deployed in another workspace."""
+    return f"https://{workspace}--gooni-api.modal.run"
+
 # ─── Volume mounts helper ─────────────────────────────────────────────────────
 
 _volumes = {
@@ -105,6 +145,23 @@ _volumes = {
     RESULTS_PATH: results_vol,
 }
 
+# Loaded pipeline per warm GPU container, keyed by model id. Only the most
+# recently used model is kept so switching models frees the previous one.
+_PIPELINES: dict = {}
+
+
+def _evict_pipelines() -> None:
+    """Drop the cached pipeline and release its host/GPU memory."""
+    if not _PIPELINES:
+        return
+    _PIPELINES.clear()
+    import gc
+    import torch
+    # Offload hooks can keep the old modules in reference cycles
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
 # ─── Video Generation Function ────────────────────────────────────────────────
 
 @app.function(
@@ -129,30 +186,38 @@ def run_video_generation(request_dict: dict, task_id: str) -> dict:
 
     model_id_key = request_dict["model"]
 
-    # Import the right pipeline
-    if model_id_key == "anisora":
-        from models.anisora import AnisoraPipeline
-        from config import MODEL_IDS, ANISORA_SUBFOLDER
-        pipeline = AnisoraPipeline(
-            hf_model_id=MODEL_IDS["anisora"],
-            subfolder=ANISORA_SUBFOLDER,
-        )
-    elif model_id_key == "phr00t":
-        from models.phr00t import Phr00tPipeline
-        from config import MODEL_IDS, PHR00T_FILENAME
-        pipeline = Phr00tPipeline(
-            hf_repo_id=MODEL_IDS["phr00t"],
-            hf_filename=PHR00T_FILENAME,
-        )
-    else:
-        raise ValueError(f"Unknown video model: {model_id_key}")
+    # Construction and load are inside the try so a load/compile failure
+    # marks the task failed instead of leaving it "processing".
+    try:
+        pipeline = _PIPELINES.get(model_id_key)
+        if pipeline is None:
+            _evict_pipelines()
+            if model_id_key == "anisora":
+                from models.anisora import AnisoraPipeline
+                from config import MODEL_IDS, ANISORA_SUBFOLDER, TORCH_COMPILE
+                pipeline = AnisoraPipeline(
+                    hf_model_id=MODEL_IDS["anisora"],
+                    subfolder=ANISORA_SUBFOLDER,
+                    compile_transformer=TORCH_COMPILE,
+                )
+            elif model_id_key == "phr00t":
+                from models.phr00t import Phr00tPipeline
+                from config import MODEL_IDS, PHR00T_FILENAME, TORCH_COMPILE
+                pipeline = Phr00tPipeline(
+                    hf_repo_id=MODEL_IDS["phr00t"],
+                    hf_filename=PHR00T_FILENAME,
+                    compile_transformer=TORCH_COMPILE,
+                )
+            else:
+                raise ValueError(f"Unknown video model: {model_id_key}")
 
-    storage.update_task_status(task_id, "processing", progress=10)
-    pipeline.load(MODEL_CACHE_PATH)
+        storage.update_task_status(task_id, "processing", progress=10)
+        pipeline.load(MODEL_CACHE_PATH)
+        # Cached only once loaded, so a failed load isn't kept around
+        _PIPELINES[model_id_key] = pipeline
 
-    storage.update_task_status(task_id, "processing", progress=20)
+        storage.update_task_status(task_id, "processing", progress=20)
 
-    try:
         result_path, preview_path = pipeline.generate(request_dict, task_id, RESULTS_PATH)
         results_vol.commit()  # Flush to volume
         storage.update_task_status(
@@ -189,23 +254,30 @@ def run_image_generation(request_dict: dict, task_id: str) -> dict:
 
     model_id_key = request_dict["model"]
 
-    if model_id_key == "pony":
-        from models.pony import PonyPipeline
-        from config import MODEL_IDS
-        pipeline = PonyPipeline(MODEL_IDS["pony"])
-    elif model_id_key == "flux":
-        from models.flux import FluxPipeline
-        from config import MODEL_IDS
-        pipeline = FluxPipeline(MODEL_IDS["flux"])
-    else:
-        raise ValueError(f"Unknown image model: {model_id_key}")
+    # Construction and load are inside the try so a load/compile failure
+    # marks the task failed instead of leaving it "processing".
+    try:
+        pipeline = _PIPELINES.get(model_id_key)
+        if pipeline is None:
+            _evict_pipelines()
+            if model_id_key == "pony":
+                from models.pony import PonyPipeline
+                from config import MODEL_IDS
+                pipeline = PonyPipeline(MODEL_IDS["pony"])
+            elif model_id_key == "flux":
+                from models.flux import FluxPipeline
+                from config import MODEL_IDS, TORCH_COMPILE
+                pipeline = FluxPipeline(MODEL_IDS["flux"], compile_transformer=TORCH_COMPILE)
+            else:
+                raise ValueError(f"Unknown image model: {model_id_key}")
 
-    storage.update_task_status(task_id, "processing", progress=10)
-    pipeline.load(MODEL_CACHE_PATH)
+        storage.update_task_status(task_id, "processing", progress=10)
+        pipeline.load(MODEL_CACHE_PATH)
+        # Cached only once loaded, so a failed load isn't kept around
+        _PIPELINES[model_id_key] = pipeline
 
-    storage.update_task_status(task_id, "processing", progress=20)
+        storage.update_task_status(task_id, "processing", progress=20)
 
-    try:
         result_path, preview_path = pipeline.generate(request_dict, task_id, RESULTS_PATH)
         results_vol.commit()
         storage.update_task_status(
@@ -260,17 +332,24 @@ def fastapi_app():
         if _p not in _sys.path:
             _sys.path.insert(0, _p)
 
-    from fastapi import Depends, FastAPI, HTTPException, Query, status, Body
+    import sqlite3
+    import threading
+    import urllib.parse
+    from contextlib import asynccontextmanager
+
+    import httpx
+    from fastapi import Depends, FastAPI, HTTPException, Query, Request, status, Body
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import FileResponse, JSONResponse, Response
+    from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, Response
+    from starlette.concurrency import run_in_threadpool
     from pydantic import BaseModel as PydanticBase
 
     import storage
     import accounts as acc_store
     from auth import verify_api_key
-    from config import MODELS_SCHEMA, DEFAULT_PAGE_SIZE, DB_PATH
+    from config import MODELS_SCHEMA_JSON, DEFAULT_PAGE_SIZE, DB_PATH
     from router import router as account_router, NoReadyAccountError, MAX_FALLBACKS
-    from deployer import deploy_account_async, deploy_all_accounts
+    from deployer import deploy_account_async, deploy_all_accounts, shutdown_deploys
     from schemas import (
         DeleteResponse,
         GalleryResponse,
@@ -283,9 +362,60 @@ def fastapi_app():
         AccountResponse,
     )
 
+    # Local generation entry points, keyed by GenerateRequest.type
+    _SPAWN = {
+        "video": run_video_generation.spawn,
+        "image": run_image_generation.spawn,
+    }
+
+    def _dispatch_local(req: GenerateRequest) -> GenerateResponse:
+        """Persist the task in this workspace's DB and spawn it on local GPUs."""
+        request_dict = req.model_dump()
+        params = {k: v for k, v in request_dict.items() if k not in _PARAMS_EXCLUDE}
+        task_id = storage.create_task(
+            model=req.model.value,
+            gen_type=req.type.value,
+            mode=req.mode,
+            prompt=req.prompt,
+            negative_prompt=req.negative_prompt,
+            parameters=params,
+            width=req.width,
+            height=req.height,
+            seed=req.seed,
+        )
+
+        request_dict["model"] = req.model.value
+        request_dict["type"] = req.type.value
+
+        _SPAWN[req.type.value](request_dict, task_id)
+        return GenerateResponse(task_id=task_id, status=TaskStatus.pending)
+
     # ── Init DB on cold start ─────────────────────────────────────────────────
     storage.init_db()
     acc_store.init_accounts_table()
+    storage.start_checkpoint_thread()
+
+    # API_KEY comes from the gooni-api-key secret and is fixed for the
+    # container, so the auth header / query string sent to other workspaces
+    # are built once.
+    _API_KEY = os.environ.get("API_KEY", "")
+    _REMOTE_HEADERS = {"X-API-Key": _API_KEY}
+    _REMOTE_QS = f"?api_key={urllib.parse.quote(_API_KEY)}" if _API_KEY else ""
+
+    # One pooled client for calls to other workspaces (/generate dispatch,
+    # /status proxying) so keep-alive connections and TLS sessions are reused.
+    _http = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+    @asynccontextmanager
+    async def _lifespan(_app):
+        yield
+        await _http.aclose()
+        shutdown_deploys()
+        await run_in_threadpool(flush_audit_log)
+        await run_in_threadpool(storage.stop_checkpoint_thread)
 
     api = FastAPI(
         title="Gooni Gooni Backend",
@@ -293,12 +423,13 @@ def fastapi_app():
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=_lifespan,
     )
 
     # Allow the frontend dev server and any deployed UI origin
     api.add_middleware(
         CORSMiddleware,
-        allow_origin_regex=".*",   # Tighten in production to your domain
+        allow_origins=["*"],   # Tighten in production to your domain
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -312,7 +443,7 @@ def fastapi_app():
     # ── GET /models ────────────────────────────────────────────────────────────
     @api.get("/models", response_model=ModelsResponse, tags=["Info"])
     async def list_models(_: str = Depends(verify_api_key)):
-        return ModelsResponse(models=MODELS_SCHEMA)
+        return Response(content=MODELS_SCHEMA_JSON, media_type="application/json")
 
     # ── POST /generate_direct ──────────────────────────────────────────────────
     @api.post(
@@ -326,34 +457,7 @@ def fastapi_app():
         _: str = Depends(verify_api_key),
     ):
         """Internal endpoint for isolated Modal account execution."""
-        params = req.model_dump(
-            exclude={"prompt", "negative_prompt", "model", "type", "mode",
-                     "width", "height", "seed",
-                     "reference_image", "first_frame_image",
-                     "last_frame_image", "arbitrary_frames"},
-        )
-        task_id = storage.create_task(
-            model=req.model.value,
-            gen_type=req.type.value,
-            mode=req.mode,
-            prompt=req.prompt,
-            negative_prompt=req.negative_prompt,
-            parameters=params,
-            width=req.width,
-            height=req.height,
-            seed=req.seed,
-        )
-
-        request_dict = req.model_dump()
-        request_dict["model"] = req.model.value
-        request_dict["type"] = req.type.value
-
-        if req.type.value == "video":
-            run_video_generation.spawn(request_dict, task_id)
-        else:
-            run_image_generation.spawn(request_dict, task_id)
-
-        return GenerateResponse(task_id=task_id, status=TaskStatus.pending)
+        return _dispatch_local(req)
 
     # ── POST /generate ─────────────────────────────────────────────────────────
     @api.post(
@@ -369,38 +473,7 @@ def fastapi_app():
         tried_accounts: list[str] = []
         last_error = ""
 
-        # Default master behavior if no accounts or fallbacks fail
-        async def _fallback_dispatch():
-            # Persist local
-            params = req.model_dump(
-                exclude={"prompt", "negative_prompt", "model", "type", "mode",
-                         "width", "height", "seed",
-                         "reference_image", "first_frame_image",
-                         "last_frame_image", "arbitrary_frames"},
-            )
-            local_task = storage.create_task(
-                model=req.model.value,
-                gen_type=req.type.value,
-                mode=req.mode,
-                prompt=req.prompt,
-                negative_prompt=req.negative_prompt,
-                parameters=params,
-                width=req.width,
-                height=req.height,
-                seed=req.seed,
-            )
-            req_dict = req.model_dump()
-            req_dict["model"] = req.model.value
-            req_dict["type"] = req.type.value
-            if req.type.value == "video":
-                run_video_generation.spawn(req_dict, local_task)
-            else:
-                run_image_generation.spawn(req_dict, local_task)
-            return GenerateResponse(task_id=local_task, status=TaskStatus.pending)
-
-        import httpx
-        api_key_env = os.environ.get("API_KEY", "")
-        headers = {"X-API-Key": api_key_env}
+        payload = req.model_dump()
 
         for attempt in range(MAX_FALLBACKS + 1):
             try:
@@ -414,13 +487,12 @@ def fastapi_app():
                 if not workspace:
                     raise Exception("Account has no workspace configured.")
 
-                remote_url = f"https://{workspace}--gooni-api.modal.run/generate_direct"
+                remote_url = _workspace_url(workspace) + "/generate_direct"
                 
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    resp = await client.post(remote_url, json=req.model_dump(), headers=headers)
-                    resp.raise_for_status()
-                    data = resp.json()
-                    remote_task_id = data["task_id"]
+                resp = await _http.post(remote_url, json=payload, headers=_REMOTE_HEADERS, timeout=30.0)
+                resp.raise_for_status()
+                data = resp.json()
+                remote_task_id = data["task_id"]
 
                 account_router.mark_success(account["id"])
                 
@@ -437,8 +509,8 @@ def fastapi_app():
                 if tried_accounts:
                     account_router.mark_failed(tried_accounts[-1], last_error)
 
-        # Fallback to local dispatch
-        return await _fallback_dispatch()
+        # Default master behavior if no accounts or fallbacks fail
+        return _dispatch_local(req)
 
     # ── GET /status/{task_id} ──────────────────────────────────────────────────
     @api.get(
@@ -452,16 +524,13 @@ def fastapi_app():
     ):
         if "::" in task_id:
             workspace, remote_task_id = task_id.split("::", 1)
-            import httpx
-            api_key = os.environ.get("API_KEY", "")
-            remote_url = f"https://{workspace}--gooni-api.modal.run/status/{remote_task_id}"
+            remote_url = f"{_workspace_url(workspace)}/status/{remote_task_id}"
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    resp = await client.get(remote_url, headers={"X-API-Key": api_key})
-                    if resp.status_code == 404:
-                        raise HTTPException(status_code=404, detail="Remote task not found")
-                    resp.raise_for_status()
-                    return resp.json()
+                resp = await _http.get(remote_url, headers=_REMOTE_HEADERS, timeout=10.0)
+                if resp.status_code == 404:
+                    raise HTTPException(status_code=404, detail="Remote task not found")
+                resp.raise_for_status()
+                return resp.json()
             except Exception as e:
                 # If remote is unreachable or failing, return 502 Bad Gateway
                 raise HTTPException(status_code=502, detail=f"Remote status fetch failed: {str(e)}")
@@ -475,15 +544,12 @@ def fastapi_app():
     @api.get("/results/{task_id}", tags=["Generation"])
     async def get_result(
         task_id: str,
+        request: Request,
         _: str = Depends(verify_api_key),
     ):
         if "::" in task_id:
-            from fastapi.responses import RedirectResponse
             workspace, remote_task_id = task_id.split("::", 1)
-            api_key = os.environ.get("API_KEY", "")
-            import urllib.parse
-            qs = f"?api_key={urllib.parse.quote(api_key)}" if api_key else ""
-            remote_url = f"https://{workspace}--gooni-api.modal.run/results/{remote_task_id}{qs}"
+            remote_url = f"{_workspace_url(workspace)}/results/{remote_task_id}{_REMOTE_QS}"
             return RedirectResponse(url=remote_url, status_code=307)
 
         task = storage.get_task(task_id)
@@ -501,31 +567,22 @@ def fastapi_app():
             raise HTTPException(status_code=404, detail="Result file not found")
 
         fpath = task_row["result_path"]
-        if not os.path.exists(fpath):
-            raise HTTPException(status_code=404, detail="Result file missing from volume")
-
-        ext = Path(fpath).suffix.lstrip(".")
-        media_types = {
-            "mp4": "video/mp4", "webm": "video/webm",
-            "png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg",
-        }
-        media_type = media_types.get(ext, "application/octet-stream")
-        from fastapi.responses import FileResponse
-        return FileResponse(fpath, media_type=media_type)
+        ext = fpath.rpartition(".")[2].lower()
+        media_type = _MEDIA_TYPES.get(ext, "application/octet-stream")
+        return _file_response(
+            fpath, media_type, request, "Result file missing from volume"
+        )
 
     # ── GET /preview/{task_id} ────────────────────────────────────────────────
     @api.get("/preview/{task_id}", tags=["Generation"])
     async def get_preview(
         task_id: str,
+        request: Request,
         _: str = Depends(verify_api_key),
     ):
         if "::" in task_id:
-            from fastapi.responses import RedirectResponse
             workspace, remote_task_id = task_id.split("::", 1)
-            api_key = os.environ.get("API_KEY", "")
-            import urllib.parse
-            qs = f"?api_key={urllib.parse.quote(api_key)}" if api_key else ""
-            remote_url = f"https://{workspace}--gooni-api.modal.run/preview/{remote_task_id}{qs}"
+            remote_url = f"{_workspace_url(workspace)}/preview/{remote_task_id}{_REMOTE_QS}"
             return RedirectResponse(url=remote_url, status_code=307)
 
         task_row = _get_raw_task(task_id)
@@ -533,11 +590,12 @@ def fastapi_app():
             raise HTTPException(status_code=404, detail="Task not found")
 
         preview_path = task_row.get("preview_path")
-        if not preview_path or not os.path.exists(preview_path):
+        if not preview_path:
             raise HTTPException(status_code=404, detail="Preview not available yet")
 
-        from fastapi.responses import FileResponse
-        return FileResponse(preview_path, media_type="image/jpeg")
+        return _file_response(
+            preview_path, "image/jpeg", request, "Preview not available yet"
+        )
 
     # ── GET /gallery ──────────────────────────────────────────────────────────
     @api.get("/gallery", response_model=GalleryResponse, tags=["Gallery"])
@@ -577,16 +635,14 @@ def fastapi_app():
         deleted = storage.delete_gallery_item(task_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Item not found")
-        results_vol.commit()
+        await run_in_threadpool(_commit_results_volume)
         return DeleteResponse(deleted=True, id=task_id)
 
     # ═════════════════════════════════════════════════════════════════════════
     # ADMIN ENDPOINTS  (require X-Admin-Key header — rate-limited + audited)
     # ═════════════════════════════════════════════════════════════════════════
 
-    import os as _os
-    from deployer import deploy_account_async, deploy_all_accounts
-    from admin_security import _ensure_audit_table, get_admin_auth
+    from admin_security import _ensure_audit_table, flush_audit_log, get_admin_auth
 
     _ensure_audit_table()
 
@@ -613,10 +669,18 @@ def fastapi_app():
         return {"id": account_id, "status": "pending", "message": "Deploying..."}
 
     # ── GET /admin/accounts ──────────────────────────────────────────────────
+    # Serialized response, keyed by acc_store.accounts_version() so any write
+    # to modal_accounts (including background deploy status updates) evicts it.
+    _accounts_cache: dict = {"version": None, "body": b""}
+
     @api.get("/admin/accounts", tags=["Admin"])
     async def admin_list_accounts(_ip: str = Depends(get_admin_auth("list_accounts"))):
-        rows = acc_store.list_accounts()
-        return {"accounts": rows}
+        version = acc_store.accounts_version()
+        if _accounts_cache["version"] != version:
+            rows = acc_store.list_accounts()
+            _accounts_cache["body"] = json.dumps({"accounts": rows}).encode()
+            _accounts_cache["version"] = version
+        return Response(content=_accounts_cache["body"], media_type="application/json")
 
     # ── DELETE /admin/accounts/{id} ──────────────────────────────────────────
     @api.delete("/admin/accounts/{account_id}", tags=["Admin"])
@@ -648,31 +712,70 @@ def fastapi_app():
 
     # ── POST /admin/deploy-all ────────────────────────────────────────────────
     @api.post("/admin/deploy-all", tags=["Admin"])
-    async def admin_deploy_all(_ip: str = Depends(get_admin_auth("deploy_all"))):
-        threads = deploy_all_accounts()
-        return {"deploying": len(threads), "message": f"Deploying {len(threads)} account(s)..."}
+    async def admin_deploy_all(
+        force: bool = True,
+        _ip: str = Depends(get_admin_auth("deploy_all")),
+    ):
+        # force=false skips ready accounts already running the current source
+        futures = deploy_all_accounts(force=force)
+        return {"deploying": len(futures), "message": f"Deploying {len(futures)} account(s)..."}
 
     # ── GET /admin/logs — Returns recent audit log entries ────────────────────
     @api.get("/admin/logs", tags=["Admin"])
     async def admin_get_logs(limit: int = 100, _ip: str = Depends(get_admin_auth("read_logs"))):
-        import sqlite3 as _sql
-        from config import DB_PATH as _db
-        if not os.path.exists(_db):
+        if not storage.DB_READY:
             return {"logs": []}
-        conn = _sql.connect(_db)
-        conn.row_factory = _sql.Row
+        await run_in_threadpool(flush_audit_log)
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
         rows = conn.execute(
             "SELECT * FROM admin_audit_log ORDER BY id DESC LIMIT ?", (limit,)
         ).fetchall()
         conn.close()
         return {"logs": [dict(r) for r in rows]}
 
-    # ── Internal helper ───────────────────────────────────────────────────────
+    # ── Internal helpers ──────────────────────────────────────────────────────
+    # results_vol.commit() is a control-plane round-trip. A caller only needs
+    # *some* commit to start after its own write, so concurrent callers queue
+    # on one lock and share whichever commit covers their ticket.
+    _commit_lock = threading.Lock()
+    _commit_seq_lock = threading.Lock()
+    _commit_seq = {"requested": 0, "committed": 0}
+
+    def _commit_results_volume() -> None:
+        with _commit_seq_lock:
+            _commit_seq["requested"] += 1
+            ticket = _commit_seq["requested"]
+        with _commit_lock:
+            if _commit_seq["committed"] >= ticket:
+                return
+            with _commit_seq_lock:
+                covered = _commit_seq["requested"]
+            results_vol.commit()
+            _commit_seq["committed"] = covered
+
+    def _file_response(
+        fpath: str, media_type: str, request: Request, missing_detail: str
+    ) -> Response:
+        """
+        Serve a volume file with a single stat(): the result is reused by
+        FileResponse and for a weak (size, mtime) ETag so polling clients
+        get a 304 instead of re-downloading unchanged files.
+        """
+        try:
+            st = os.stat(fpath)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail=missing_detail)
+
+        etag = f'W/"{st.st_size:x}-{int(st.st_mtime):x}"'
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=5"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return FileResponse(fpath, media_type=media_type, stat_result=st, headers=headers)
+
     def _get_raw_task(task_id: str) -> Optional[dict]:
         """Return raw task dict from DB for file-serving endpoints."""
-        import sqlite3
-        from config import DB_PATH
-        if not os.path.exists(DB_PATH):
+        if not storage.DB_READY:
             return None
         conn = sqlite3.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
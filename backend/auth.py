@@ -3,7 +3,9 @@ API key authentication middleware.
 The key is stored in Modal Secret named 'gooni-api-key' as env var API_KEY.
 """
 import hmac
+import logging
 import os
+from typing import NamedTuple
 
 from fastapi import HTTPException, Security, status, Query
 from fastapi.security import APIKeyHeader
@@ -11,6 +13,27 @@ from fastapi.security import APIKeyHeader
 _API_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+class _AuthState(NamedTuple):
+    expected_bytes: bytes   # encoded API_KEY (b"" when unset)
+    configured: bool        # False → fail-open local dev mode
+
+
+def _compute_auth_state() -> _AuthState:
+    expected = os.environ.get("API_KEY", "").encode()
+    return _AuthState(expected_bytes=expected, configured=bool(expected))
+
+
+# Modal injects secrets before the container imports this module, so the key
+# is fixed for the lifetime of the process.
+_AUTH_STATE = _compute_auth_state()
+
+
+def _reset_auth_state() -> None:
+    """Re-read API_KEY from the environment (tests)."""
+    global _AUTH_STATE
+    _AUTH_STATE = _compute_auth_state()
+
+
 def verify_api_key(
     header_key: str = Security(_API_KEY_HEADER),
     query_key: str = Query(None, alias="api_key"),
@@ -19,18 +42,17 @@ def verify_api_key(
     FastAPI dependency — raises 403 if API key is missing or wrong.
     Uses constant-time comparison to prevent timing attacks.
     """
-    api_key = header_key or query_key
-    expected = os.environ.get("API_KEY", "")
-    if not expected:
+    state = _AUTH_STATE
+    if not state.configured:
         # Fail-open only in local dev (no secret configured); log a warning.
-        import logging
         logging.warning(
             "API_KEY environment variable is not set. "
             "All requests will be allowed. Set it via Modal Secret in production."
         )
         return ""
 
-    if not api_key or not hmac.compare_digest(api_key.encode(), expected.encode()):
+    api_key = header_key or query_key
+    if not api_key or not hmac.compare_digest(api_key.encode(), state.expected_bytes):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid or missing X-API-Key header.",
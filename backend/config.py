@@ -2,61 +2,123 @@
 Configuration for the Gooni Gooni Modal backend.
 All sensitive values come from Modal Secrets / environment variables.
 """
+import json
 import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
 
 # ─── App identity ──────────────────────────────────────────────────────────────
 APP_NAME = "gooni-gooni-backend"
 
-# ─── Volume names ──────────────────────────────────────────────────────────────
-MODEL_CACHE_VOLUME = os.environ.get("CACHE_VOLUME", "model-cache")
-RESULTS_VOLUME_NAME = os.environ.get("RESULTS_VOLUME", "results")
-
 # Internal mount paths inside the Modal container
 MODEL_CACHE_PATH = "/model-cache"
 RESULTS_PATH = "/results"
 DB_PATH = f"{RESULTS_PATH}/gallery.db"
 
+
+# ─── Environment-driven settings ───────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Every env-var override, parsed once. Access is a plain attribute load."""
+
+    # Volume names
+    cache_volume: str
+    results_volume: str
+
+    # HuggingFace model identifiers (see MODEL_IDS below for the repos)
+    model_ids: Mapping[str, str]   # read-only view
+    anisora_subfolder: str
+    phr00t_filename: str
+
+    # GPU config
+    video_gpu: str
+    image_gpu: str
+    video_concurrency: int
+    image_concurrency: int
+    video_timeout: int
+    image_timeout: int
+
+    # Account deploys
+    deploy_concurrency: int
+
+    # Inference
+    torch_compile: bool
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        env = os.environ.get
+        return cls(
+            cache_volume=env("CACHE_VOLUME", "model-cache"),
+            results_volume=env("RESULTS_VOLUME", "results"),
+            model_ids=MappingProxyType({
+                # Video – Official Wan2.1 14B Diffusers (fallback since Index-anisora lacks diffusers format)
+                # Repo: https://huggingface.co/Wan-AI/Wan2.1-T2V-14B-Diffusers
+                "anisora": env("ANISORA_MODEL_ID", "Wan-AI/Wan2.1-T2V-14B-Diffusers"),
+
+                # Realistic video – Phr00t WAN 2.2 Rapid-AllInOne NSFW (single safetensors)
+                # Repo: https://huggingface.co/Phr00t/WAN2.2-14B-Rapid-AllInOne
+                # File loaded via from_single_file() — see models/phr00t.py
+                "phr00t": env("PHR00T_MODEL_ID", "Phr00t/WAN2.2-14B-Rapid-AllInOne"),
+
+                # Anime image – Pony Diffusion V6 XL (full SDXL pipeline)
+                # Repo: https://huggingface.co/Polenov2024/Pony-Diffusion-V6-XL
+                "pony": env("PONY_MODEL_ID", "Polenov2024/Pony-Diffusion-V6-XL"),
+
+                # Realistic image – Flux.1 [dev] (base repo, NF4 quantized on-the-fly via BnB)
+                # Repo: https://huggingface.co/black-forest-labs/FLUX.1-dev
+                "flux": env("FLUX_MODEL_ID", "black-forest-labs/FLUX.1-dev"),
+            }),
+            # Subfolder is not used for the official diffusers model
+            anisora_subfolder=env("ANISORA_SUBFOLDER", ""),
+            # Filename of the Phr00t single-file checkpoint to download (latest Mega-v12)
+            phr00t_filename=env(
+                "PHR00T_FILENAME",
+                "wan2.2-rapid-mega-aio-nsfw-v12.2.safetensors",
+            ),
+            video_gpu=env("VIDEO_GPU", "A10G"),  # 24 GB VRAM
+            image_gpu=env("IMAGE_GPU", "T4"),    # 16 GB VRAM
+            video_concurrency=int(env("VIDEO_CONCURRENCY", "1")),
+            image_concurrency=int(env("IMAGE_CONCURRENCY", "2")),
+            video_timeout=int(env("VIDEO_TIMEOUT", "900")),   # 15 min
+            image_timeout=int(env("IMAGE_TIMEOUT", "300")),   # 5 min
+            deploy_concurrency=int(env("DEPLOY_CONCURRENCY", "4")),
+            torch_compile=env("TORCH_COMPILE", "0").lower() in ("1", "true", "yes"),
+        )
+
+
+SETTINGS = Settings.from_env()
+
+# ─── Volume names ──────────────────────────────────────────────────────────────
+MODEL_CACHE_VOLUME = SETTINGS.cache_volume
+RESULTS_VOLUME_NAME = SETTINGS.results_volume
+
 # ─── HuggingFace model identifiers ─────────────────────────────────────────────
 # Override these via Modal Secrets / env vars for your private/licensed models.
-MODEL_IDS: dict[str, str] = {
-    # Video – Official Wan2.1 14B Diffusers (fallback since Index-anisora lacks diffusers format)
-    # Repo: https://huggingface.co/Wan-AI/Wan2.1-T2V-14B-Diffusers
-    "anisora": os.environ.get("ANISORA_MODEL_ID", "Wan-AI/Wan2.1-T2V-14B-Diffusers"),
-
-    # Realistic video – Phr00t WAN 2.2 Rapid-AllInOne NSFW (single safetensors)
-    # Repo: https://huggingface.co/Phr00t/WAN2.2-14B-Rapid-AllInOne
-    # File loaded via from_single_file() — see models/phr00t.py
-    "phr00t": os.environ.get("PHR00T_MODEL_ID", "Phr00t/WAN2.2-14B-Rapid-AllInOne"),
-
-    # Anime image – Pony Diffusion V6 XL (full SDXL pipeline)
-    # Repo: https://huggingface.co/Polenov2024/Pony-Diffusion-V6-XL
-    "pony": os.environ.get("PONY_MODEL_ID", "Polenov2024/Pony-Diffusion-V6-XL"),
-
-    # Realistic image – Flux.1 [dev] (base repo, NF4 quantized on-the-fly via BnB)
-    # Repo: https://huggingface.co/black-forest-labs/FLUX.1-dev
-    "flux": os.environ.get("FLUX_MODEL_ID", "black-forest-labs/FLUX.1-dev"),
-}
-
-# Subfolder is not used for the official diffusers model
-ANISORA_SUBFOLDER = os.environ.get("ANISORA_SUBFOLDER", "")
-
-# Filename of the Phr00t single-file checkpoint to download (latest Mega-v12)
-PHR00T_FILENAME = os.environ.get(
-    "PHR00T_FILENAME",
-    "wan2.2-rapid-mega-aio-nsfw-v12.2.safetensors",
-)
+MODEL_IDS: Mapping[str, str] = SETTINGS.model_ids
+ANISORA_SUBFOLDER = SETTINGS.anisora_subfolder
+PHR00T_FILENAME = SETTINGS.phr00t_filename
 
 # ─── GPU config ────────────────────────────────────────────────────────────────
-VIDEO_GPU = os.environ.get("VIDEO_GPU", "A10G")  # 24 GB VRAM
-IMAGE_GPU = os.environ.get("IMAGE_GPU", "T4")    # 16 GB VRAM
+VIDEO_GPU = SETTINGS.video_gpu
+IMAGE_GPU = SETTINGS.image_gpu
 
 # Maximum concurrent executions per function
-VIDEO_CONCURRENCY = int(os.environ.get("VIDEO_CONCURRENCY", "1"))
-IMAGE_CONCURRENCY = int(os.environ.get("IMAGE_CONCURRENCY", "2"))
+VIDEO_CONCURRENCY = SETTINGS.video_concurrency
+IMAGE_CONCURRENCY = SETTINGS.image_concurrency
 
 # Timeout per generation job (seconds)
-VIDEO_TIMEOUT = int(os.environ.get("VIDEO_TIMEOUT", "900"))   # 15 min
-IMAGE_TIMEOUT = int(os.environ.get("IMAGE_TIMEOUT", "300"))   # 5 min
+VIDEO_TIMEOUT = SETTINGS.video_timeout
+IMAGE_TIMEOUT = SETTINGS.image_timeout
+
+# ─── Account deploys ───────────────────────────────────────────────────────────
+# Max `modal deploy` subprocesses running at once (e.g. during "deploy all")
+DEPLOY_CONCURRENCY = SETTINGS.deploy_concurrency
+
+# ─── Inference ─────────────────────────────────────────────────────────────────
+# torch.compile the denoiser blocks at load time (slower cold start, faster steps)
+TORCH_COMPILE = SETTINGS.torch_compile
 
 # ─── Gallery defaults ──────────────────────────────────────────────────────────
 DEFAULT_PAGE_SIZE = 20
@@ -148,3 +210,9 @@ MODELS_SCHEMA = [
         },
     },
 ]
+
+# Pre-serialized /models payload — the schema is static, so it is encoded once
+# at import instead of being re-validated and re-serialized per request.
+MODELS_SCHEMA_JSON: bytes = json.dumps(
+    {"models": MODELS_SCHEMA}, separators=(",", ":")
+).encode("utf-8")
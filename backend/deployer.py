@@ -5,66 +5,119 @@ Each account has its own MODAL_TOKEN_ID + MODAL_TOKEN_SECRET.
 We spawn a subprocess with those env vars injected so that
 `modal deploy` authenticates as that specific workspace.
 
-The deploy runs in a background thread so the API response is not blocked.
+Deploys run on a bounded thread pool (DEPLOY_CONCURRENCY workers) so the API
+response is not blocked and "deploy all" can't fork one subprocess per account
+at once.
 Status transitions:
   pending → (deploy running) → ready
                              → failed
 """
 from __future__ import annotations
 
+import hashlib
 import os
+import re
 import subprocess
 import sys
 import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import accounts as acc_store
+from config import DEPLOY_CONCURRENCY
 
 # Path to the main Modal app file (relative to repo root)
 BACKEND_DIR = Path(__file__).parent
 APP_FILE = str(BACKEND_DIR / "app.py")
+_DEPLOY_CMD = (sys.executable, "-m", "modal", "deploy", APP_FILE)
 
+# WORKSPACE from the first https://WORKSPACE--<label>.modal.run URL
+_WORKSPACE_RE = re.compile(r"https://([A-Za-z0-9][A-Za-z0-9-]*?)--[\w.-]*?modal\.run")
 
-def deploy_account(account_id: str) -> None:
+# Extra env for the `modal deploy` child: unbuffered UTF-8 output so the log
+# streams line by line and decodes (✓ etc.) regardless of the host locale,
+# and no .pyc writes from a short-lived CLI process.
+_DEPLOY_ENV_OVERRIDES = {
+    "PYTHONUNBUFFERED": "1",
+    "PYTHONIOENCODING": "utf-8",
+    "PYTHONDONTWRITEBYTECODE": "1",
+}
+
+DEPLOY_TIMEOUT = 300           # 5 min deploy timeout
+DEPLOY_LOG_TAIL_LINES = 256    # deploy output kept for error reporting
+
+# Env vars app.py reads while being deployed; part of the deploy digest
+_DEPLOY_DIGEST_ENV = (
+    "VIDEO_GPU", "VIDEO_CONCURRENCY", "IMAGE_GPU", "IMAGE_CONCURRENCY",
+    "DEPLOY_CONCURRENCY", "TORCH_COMPILE",
+)
+
+# Backend modules shipped by `modal deploy` (relative to BACKEND_DIR). Not a
+# recursive walk: in the container BACKEND_DIR is /root.
+_DEPLOY_SOURCE_GLOBS = ("*.py", "models/*.py")
+
+# (source file signature, blake2b state over the sources)
+_digest_cache: Optional[tuple[tuple, "hashlib._Hash"]] = None
+
+_DEPLOY_POOL = ThreadPoolExecutor(
+    max_workers=max(1, DEPLOY_CONCURRENCY),
+    thread_name_prefix="deploy",
+)
+
+# account_id → (Future of its queued/running deploy, whether it was forced)
+_INFLIGHT: dict[str, tuple[Future, bool]] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def deploy_account(account_id: str, force: bool = True) -> None:
     """
     Deploy backend/app.py using the account's Modal credentials.
     Updates account status to 'ready' or 'failed'.
-    Should be called in a background thread (non-blocking for the caller).
+    With force=False, a 'ready' account whose last successful deploy had the
+    same source/env digest is left alone.
+    Should be called via deploy_account_async (non-blocking for the caller).
     """
     account = acc_store.get_account(account_id)
     if account is None:
         return
 
-    acc_store.update_account_status(account_id, "pending")
+    # Still computed when forced so a successful deploy records it
+    digest = _try_deploy_digest()
+    if (
+        not force
+        and digest is not None
+        and account["status"] == "ready"
+        and account.get("deployed_digest") == digest
+    ):
+        return
+
+    # Freshly added accounts are already 'pending' (with no error) — skip the
+    # redundant write and only reset status for redeploys.
+    if account["status"] != "pending" or account.get("last_error"):
+        acc_store.update_account_status(account_id, "pending")
 
     # Build a clean env with the account's Modal credentials
-    env = {**os.environ}
+    env = {**os.environ, **_DEPLOY_ENV_OVERRIDES}
     env["MODAL_TOKEN_ID"] = account["token_id"]
     env["MODAL_TOKEN_SECRET"] = account["token_secret"]
     # Remove any existing Modal profile env to avoid conflicts
     env.pop("MODAL_PROFILE", None)
 
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "modal", "deploy", APP_FILE],
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 min deploy timeout
-        )
+        returncode, workspace, tail = _run_modal_deploy(env)
 
-        if result.returncode == 0:
-            # Try to extract workspace name from output
-            workspace = _extract_workspace(result.stdout)
+        if returncode == 0:
             acc_store.update_account_status(
                 account_id,
                 "ready",
                 workspace=workspace,
                 error=None,
+                deployed_digest=digest,
             )
         else:
-            error = (result.stderr or result.stdout or "Unknown deploy error")[:500]
+            error = (tail or "Unknown deploy error")[-500:]
             acc_store.update_account_status(account_id, "failed", error=error)
 
     except subprocess.TimeoutExpired:
@@ -75,35 +128,219 @@ def deploy_account(account_id: str) -> None:
         acc_store.update_account_status(account_id, "failed", error=str(exc))
 
 
-def deploy_account_async(account_id: str) -> threading.Thread:
+def _run_modal_deploy(env: dict) -> tuple[int, Optional[str], str]:
     """
-    Kick off deploy_account in a background thread.
-    Returns the thread (already started).
+    Run `modal deploy` and stream its combined stdout/stderr line by line.
+    Only the last DEPLOY_LOG_TAIL_LINES lines are kept (for error messages);
+    the workspace is picked out of the stream as soon as its URL appears.
+    Returns (returncode, workspace, tail). Raises subprocess.TimeoutExpired
+    if the deploy runs longer than DEPLOY_TIMEOUT seconds.
     """
-    thread = threading.Thread(
-        target=deploy_account,
-        args=(account_id,),
-        daemon=True,
-        name=f"deploy-{account_id[:8]}",
+    proc = subprocess.Popen(
+        _DEPLOY_CMD,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
     )
-    thread.start()
-    return thread
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(DEPLOY_TIMEOUT, _kill)
+    # Daemon so a pending watchdog never holds up interpreter exit by itself
+    watchdog.daemon = True
+    watchdog.start()
+    tail: deque[str] = deque(maxlen=DEPLOY_LOG_TAIL_LINES)
+    workspace: Optional[str] = None
+    try:
+        for line in proc.stdout:
+            tail.append(line)
+            if workspace is None and "modal.run" in line:
+                workspace = _extract_workspace(line)
+        returncode = proc.wait()
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(_DEPLOY_CMD, DEPLOY_TIMEOUT)
+    return returncode, workspace, "".join(tail)
+
+
+def deploy_account_async(account_id: str, force: bool = True) -> Future:
+    """
+    Queue deploy_account on the deploy pool.
+    Returns the Future for the queued deploy; if a deploy for the same
+    account is already queued or running and was submitted with at least
+    the same force, returns that Future instead. A forced call arriving
+    while an unforced deploy is in flight queues a forced deploy to run
+    right after it.
+    """
+    previous = None
+    with _INFLIGHT_LOCK:
+        entry = _INFLIGHT.get(account_id)
+        if entry is not None and not entry[0].done():
+            if entry[1] or not force:
+                return entry[0]
+            previous = entry[0]
+            future = Future()
+        else:
+            future = _DEPLOY_POOL.submit(deploy_account, account_id, force)
+        _INFLIGHT[account_id] = (future, force)
+
+    def _forget(done: Future) -> None:
+        with _INFLIGHT_LOCK:
+            entry = _INFLIGHT.get(account_id)
+            if entry is not None and entry[0] is done:
+                del _INFLIGHT[account_id]
+
+    # Callbacks are registered outside the lock: they run inline if the
+    # future has already finished.
+    if previous is not None:
+        previous.add_done_callback(lambda _: _submit_into(future, account_id, force))
+    future.add_done_callback(_forget)
+    return future
+
+
+def _submit_into(target: Future, account_id: str, force: bool) -> None:
+    """Submit deploy_account to the pool and mirror its outcome into target."""
+    try:
+        inner = _DEPLOY_POOL.submit(deploy_account, account_id, force)
+    except RuntimeError:  # pool shut down — the follow-up deploy is dropped
+        target.cancel()
+        return
+
+    def _mirror(done: Future) -> None:
+        if done.cancelled():
+            target.cancel()
+        elif done.exception() is not None:
+            target.set_exception(done.exception())
+        else:
+            target.set_result(done.result())
+
+    inner.add_done_callback(_mirror)
 
 
-def deploy_all_accounts() -> list[threading.Thread]:
+def shutdown_deploys(cancel_futures: bool = True) -> None:
     """
-    Redeploy ALL ready (and failed) accounts simultaneously.
-    Skips accounts that are 'disabled'.
-    Returns list of started threads.
+    Stop accepting deploys and (by default) drop those still waiting for a
+    pool worker, so process exit doesn't block on them — pool workers are
+    non-daemon and joined at interpreter exit. Deploys already running
+    finish or are killed by their DEPLOY_TIMEOUT watchdog. Accounts whose
+    dropped deploy would have been their first (still 'pending') are marked
+    failed so they don't show as deploying forever; others keep their status.
+    Runs from the API lifespan and, as a backstop, at interpreter exit.
+    """
+    with _INFLIGHT_LOCK:
+        inflight = [(account_id, entry[0]) for account_id, entry in _INFLIGHT.items()]
+    _DEPLOY_POOL.shutdown(wait=False, cancel_futures=cancel_futures)
+
+    for account_id, future in inflight:
+        if not future.cancelled():
+            continue
+        account = acc_store.get_account(account_id)
+        if account is not None and account["status"] == "pending":
+            acc_store.update_account_status(
+                account_id, "failed", error="Deploy cancelled on shutdown"
+            )
+
+
+def _shutdown_deploys_at_exit() -> None:
+    try:
+        shutdown_deploys()
+    except Exception:  # best effort — the accounts DB may already be gone
+        pass
+
+
+# ThreadPoolExecutor joins its workers from a threading exit hook, which runs
+# before atexit handlers. Hooks run last-registered-first, so this one cancels
+# queued deploys before that join on every exit path, not only the lifespan.
+threading._register_atexit(_shutdown_deploys_at_exit)
+
+
+def deploy_all_accounts(force: bool = True) -> list[Future]:
+    """
+    Redeploy ALL ready (and failed) accounts, DEPLOY_CONCURRENCY at a time.
+    Skips accounts that are 'disabled'. With force=False, also skips ready
+    accounts whose last deploy matches the current source digest — the DB
+    can't tell whether the app still exists in the workspace, so forcing is
+    the default.
+    Returns list of queued Futures (skipped accounts are not included).
     """
     all_accounts = acc_store.list_accounts()
-    threads = []
+    digest = None if force else _try_deploy_digest()
+    futures = []
     for account in all_accounts:
         if account["status"] == "disabled":
             continue
-        thread = deploy_account_async(account["id"])
-        threads.append(thread)
-    return threads
+        if (
+            digest is not None
+            and account["status"] == "ready"
+            and account.get("deployed_digest") == digest
+        ):
+            continue
+        futures.append(deploy_account_async(account["id"], force=force))
+    return futures
+
+
+def _source_files() -> list[tuple[Path, os.stat_result]]:
+    """The backend package's own modules, each stat'ed once; vanished or
+    dangling entries are skipped."""
+    files = []
+    for pattern in _DEPLOY_SOURCE_GLOBS:
+        for path in BACKEND_DIR.glob(pattern):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((path, st))
+    files.sort(key=lambda entry: entry[0])
+    return files
+
+
+def _deploy_digest() -> str:
+    """
+    Digest of everything `modal deploy` ships or reads at deploy time: the
+    backend modules uploaded via add_local_dir, plus the env vars app.py
+    evaluates while being deployed. Recomputed only when a source file's
+    mtime/size changes.
+    """
+    global _digest_cache
+    files = _source_files()
+    signature = tuple((str(p), st.st_mtime_ns, st.st_size) for p, st in files)
+    if _digest_cache is None or _digest_cache[0] != signature:
+        h = hashlib.blake2b(digest_size=16)
+        for p, _ in files:
+            try:
+                data = p.read_bytes()
+            except OSError:  # removed since the stat
+                continue
+            h.update(str(p.relative_to(BACKEND_DIR)).encode())
+            h.update(b"\0")
+            h.update(data)
+            h.update(b"\0")
+        _digest_cache = (signature, h)
+    h = _digest_cache[1].copy()
+    for key in _DEPLOY_DIGEST_ENV:
+        h.update(f"{key}={os.environ.get(key, '')}\0".encode())
+    return h.hexdigest()
+
+
+def _try_deploy_digest() -> Optional[str]:
+    """
+    _deploy_digest(), or None if it can't be computed. The digest only lets
+    unchanged accounts be skipped, so a failure must never block a deploy —
+    None never matches a stored digest and is never recorded.
+    """
+    try:
+        return _deploy_digest()
+    except Exception:
+        return None
 
 
 def _extract_workspace(output: str) -> Optional[str]:
@@ -112,13 +349,5 @@ def _extract_workspace(output: str) -> Optional[str]:
     Modal typically prints something like:
       ✓ Deployed app at https://WORKSPACE--gooni-api.modal.run
     """
-    for line in output.splitlines():
-        if "modal.run" in line:
-            # Extract WORKSPACE from https://WORKSPACE--gooni-api.modal.run
-            try:
-                url = [w for w in line.split() if "modal.run" in w][0]
-                workspace = url.split("//")[1].split("--")[0]
-                return workspace
-            except (IndexError, ValueError):
-                pass
-    return None
+    match = _WORKSPACE_RE.search(output)
+    return match.group(1) if match else None
@@ -31,9 +31,15 @@ from storage import result_file_path, preview_file_path
 class AnisoraPipeline(BasePipeline):
     """Index-AniSora V3.2 – anime video generation (Wan2.2 base)."""
 
-    def __init__(self, hf_model_id: str, subfolder: str = "V3.2"):
+    def __init__(
+        self,
+        hf_model_id: str,
+        subfolder: str = "V3.2",
+        compile_transformer: bool = False,
+    ):
         self.hf_model_id = hf_model_id
         self.subfolder = subfolder
+        self.compile_transformer = compile_transformer
         self.pipeline = None
         self._loaded = False
 
@@ -70,6 +76,12 @@ class AnisoraPipeline(BasePipeline):
             self._i2v.vae.enable_slicing()
             self._i2v.vae.enable_tiling()
 
+        if self.compile_transformer:
+            # Compilation is lazy: the first t2v / i2v request on this
+            # container pays it for that pipeline's transformer.
+            self.compile_denoiser(self._t2v)
+            self.compile_denoiser(self._i2v)
+
         self._loaded = True
         print("[anisora] Model loaded ✓")
 
@@ -104,34 +116,35 @@ class AnisoraPipeline(BasePipeline):
             generator=generator,
         )
 
-        if mode == "t2v":
-            output = self._t2v(**shared)
-            frames = output.frames[0]
-
-        elif mode == "i2v":
-            ref_img = self.decode_image(request["reference_image"])
-            output = self._i2v(image=ref_img, **shared)
-            frames = output.frames[0]
-
-        elif mode == "first_last_frame":
-            # Wan2.2 I2V: pass image list [first, last] for interpolation
-            first = self.decode_image(request["first_frame_image"])
-            last = self.decode_image(request["last_frame_image"])
-            output = self._i2v(image=[first, last], **shared)
-            frames = output.frames[0]
-
-        elif mode == "arbitrary_frame":
-            # Multi-keyframe: sort by frame_index, pass as image list
-            keyframes_raw = request.get("arbitrary_frames", [])
-            keyframes_sorted = sorted(
-                keyframes_raw, key=lambda x: x.get("frame_index", 0)
-            )
-            images = [self.decode_image(kf["image"]) for kf in keyframes_sorted]
-            output = self._i2v(image=images, **shared)
-            frames = output.frames[0]
-
-        else:
-            raise ValueError(f"Unsupported mode for anisora: {mode}")
+        with self.eager_fallback():
+            if mode == "t2v":
+                output = self._t2v(**shared)
+                frames = output.frames[0]
+
+            elif mode == "i2v":
+                ref_img = self.decode_image(request["reference_image"])
+                output = self._i2v(image=ref_img, **shared)
+                frames = output.frames[0]
+
+            elif mode == "first_last_frame":
+                # Wan2.2 I2V: pass image list [first, last] for interpolation
+                first = self.decode_image(request["first_frame_image"])
+                last = self.decode_image(request["last_frame_image"])
+                output = self._i2v(image=[first, last], **shared)
+                frames = output.frames[0]
+
+            elif mode == "arbitrary_frame":
+                # Multi-keyframe: sort by frame_index, pass as image list
+                keyframes_raw = request.get("arbitrary_frames", [])
+                keyframes_sorted = sorted(
+                    keyframes_raw, key=lambda x: x.get("frame_index", 0)
+                )
+                images = [self.decode_image(kf["image"]) for kf in keyframes_sorted]
+                output = self._i2v(image=images, **shared)
+                frames = output.frames[0]
+
+            else:
+                raise ValueError(f"Unsupported mode for anisora: {mode}")
 
         # Save video
         self._export_video(frames, out_path, fps, output_format)
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import abc
 import base64
+import contextlib
 import io
 import random
 from typing import Optional
@@ -19,6 +20,7 @@ class BasePipeline(abc.ABC):
     """
 
     model_id: str  # HuggingFace repo ID or local path
+    compile_transformer: bool = False  # set by subclasses that call compile_denoiser
 
     @abc.abstractmethod
     def load(self, cache_path: str) -> None:
@@ -65,6 +67,38 @@ class BasePipeline(abc.ABC):
         thumb.thumbnail(size, Image.LANCZOS)
         thumb.save(save_path, "JPEG", quality=85)
 
+    @staticmethod
+    def compile_denoiser(pipe) -> None:
+        """
+        torch.compile each repeated block of `pipe.transformer`
+        (Flux: transformer_blocks + single_transformer_blocks, Wan: blocks).
+        Compiling per block keeps compile time to roughly one block's worth
+        and leaves the enable_model_cpu_offload() hooks on the top-level
+        module running eagerly. Compilation itself happens on the first
+        forward; wrap pipeline calls in eager_fallback() to survive it.
+        """
+        transformer = getattr(pipe, "transformer", None)
+        if transformer is None:
+            return
+        try:
+            for attr in ("transformer_blocks", "single_transformer_blocks", "blocks"):
+                for block in getattr(transformer, attr, None) or ():
+                    block.compile()
+        except Exception as exc:
+            print(f"[compile] torch.compile unavailable, running eager: {exc}")
+
+    def eager_fallback(self) -> contextlib.AbstractContextManager:
+        """
+        Context for pipeline calls on a compiled denoiser: if Inductor fails
+        on the lazy compile (e.g. no C compiler for Triton), dynamo runs that
+        graph eagerly instead of failing the generation. Scoped to the call,
+        so the process-wide dynamo config is left alone.
+        """
+        if not self.compile_transformer:
+            return contextlib.nullcontext()
+        import torch._dynamo
+        return torch._dynamo.config.patch(suppress_errors=True)
+
     @staticmethod
     def make_preview_from_video(video_path: str, preview_path: str, size: tuple[int, int] = (512, 512)) -> None:
         """Extract the first frame of an MP4 and save as JPEG thumbnail."""
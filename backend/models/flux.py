@@ -25,8 +25,9 @@ from storage import result_file_path, preview_file_path
 class FluxPipeline(BasePipeline):
     """Flux.1 [dev] NF4 – realistic image generation in 16 GB VRAM."""
 
-    def __init__(self, hf_model_id: str):
+    def __init__(self, hf_model_id: str, compile_transformer: bool = False):
         self.hf_model_id = hf_model_id
+        self.compile_transformer = compile_transformer
         self._loaded = False
 
     # ─── Load ─────────────────────────────────────────────────────────────────
@@ -59,6 +60,11 @@ class FluxPipeline(BasePipeline):
 
         self._img2img = FluxImg2ImgPipeline.from_pipe(self._txt2img)
 
+        if self.compile_transformer:
+            # _img2img shares the transformer, so one compile covers both.
+            # Compilation is lazy: the first request on this container pays it.
+            self.compile_denoiser(self._txt2img)
+
         self._loaded = True
         print("[flux] Model loaded ✓")
 
@@ -83,31 +89,32 @@ class FluxPipeline(BasePipeline):
         out_path = result_file_path(task_id, output_format)
         prev_path = preview_file_path(task_id)
 
-        if mode == "txt2img":
-            image = self._txt2img(
-                prompt=prompt,
-                negative_prompt=negative_prompt or None,
-                width=width,
-                height=height,
-                num_inference_steps=steps,
-                guidance_scale=guidance_scale,
-                generator=generator,
-            ).images[0]
-
-        elif mode == "img2img":
-            ref_img = self.decode_image(request["reference_image"]).resize((width, height), Image.LANCZOS)
-            image = self._img2img(
-                prompt=prompt,
-                negative_prompt=negative_prompt or None,
-                image=ref_img,
-                strength=denoising_strength,
-                num_inference_steps=steps,
-                guidance_scale=guidance_scale,
-                generator=generator,
-            ).images[0]
-
-        else:
-            raise ValueError(f"Unsupported mode for flux: {mode}")
+        with self.eager_fallback():
+            if mode == "txt2img":
+                image = self._txt2img(
+                    prompt=prompt,
+                    negative_prompt=negative_prompt or None,
+                    width=width,
+                    height=height,
+                    num_inference_steps=steps,
+                    guidance_scale=guidance_scale,
+                    generator=generator,
+                ).images[0]
+
+            elif mode == "img2img":
+                ref_img = self.decode_image(request["reference_image"]).resize((width, height), Image.LANCZOS)
+                image = self._img2img(
+                    prompt=prompt,
+                    negative_prompt=negative_prompt or None,
+                    image=ref_img,
+                    strength=denoising_strength,
+                    num_inference_steps=steps,
+                    guidance_scale=guidance_scale,
+                    generator=generator,
+                ).images[0]
+
+            else:
+                raise ValueError(f"Unsupported mode for flux: {mode}")
 
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
         image.save(out_path)
@@ -41,9 +41,11 @@ class Phr00tPipeline(BasePipeline):
         self,
         hf_repo_id: str,
         hf_filename: str = "wan2.2-rapid-mega-aio-nsfw-v12.2.safetensors",
+        compile_transformer: bool = False,
     ):
         self.hf_repo_id = hf_repo_id
         self.hf_filename = hf_filename
+        self.compile_transformer = compile_transformer
         self._pipeline = None
         self._i2v_pipeline = None
         self._loaded = False
@@ -84,6 +86,12 @@ class Phr00tPipeline(BasePipeline):
         if hasattr(self._i2v_pipeline, "vae"):
             self._i2v_pipeline.vae.enable_slicing()
 
+        if self.compile_transformer:
+            # Compilation is lazy: the first t2v / i2v request on this
+            # container pays it for that pipeline's transformer.
+            self.compile_denoiser(self._pipeline)
+            self.compile_denoiser(self._i2v_pipeline)
+
         self._loaded = True
         print("[phr00t] Model loaded ✓")
 
@@ -128,23 +136,24 @@ class Phr00tPipeline(BasePipeline):
             generator=generator,
         )
 
-        if mode == "t2v":
-            output = self._pipeline(**shared)
-            frames = output.frames[0]
+        with self.eager_fallback():
+            if mode == "t2v":
+                output = self._pipeline(**shared)
+                frames = output.frames[0]
 
-        elif mode == "i2v":
-            ref_img = self.decode_image(request["reference_image"])
-            output = self._i2v_pipeline(image=ref_img, **shared)
-            frames = output.frames[0]
+            elif mode == "i2v":
+                ref_img = self.decode_image(request["reference_image"])
+                output = self._i2v_pipeline(image=ref_img, **shared)
+                frames = output.frames[0]
 
-        elif mode == "first_last_frame":
-            first = self.decode_image(request["first_frame_image"])
-            last = self.decode_image(request["last_frame_image"])
-            output = self._i2v_pipeline(image=[first, last], **shared)
-            frames = output.frames[0]
+            elif mode == "first_last_frame":
+                first = self.decode_image(request["first_frame_image"])
+                last = self.decode_image(request["last_frame_image"])
+                output = self._i2v_pipeline(image=[first, last], **shared)
+                frames = output.frames[0]
 
-        else:
-            raise ValueError(f"Unsupported mode for phr00t: {mode}")
+            else:
+                raise ValueError(f"Unsupported mode for phr00t: {mode}")
 
         # Save video
         self._export_video(frames, out_path, fps, output_format)
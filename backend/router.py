@@ -7,9 +7,10 @@ Rotation rules:
   3. On account failure: mark it 'failed', try next candidate (up to MAX_FALLBACKS)
   4. After MAX_FALLBACKS exhausted → raise NoReadyAccountError
 
-The router is stateless at module level; it reads account state fresh from
-the DB on every pick() call so that status changes (new account goes ready,
-admin disables an account) are picked up without restart.
+The router is stateless at module level; it reads account state through
+accounts.list_ready_accounts(), whose snapshot is invalidated by every write
+to modal_accounts, so status changes (new account goes ready, admin disables
+an account) are picked up without restart.
 """
 from __future__ import annotations
 
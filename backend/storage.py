@@ -5,11 +5,14 @@ The database lives inside the Modal 'results' Volume at /results/gallery.db.
 from __future__ import annotations
 
 import json
+import logging
 import os
 import sqlite3
+import threading
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generator, Optional
 
@@ -41,6 +44,13 @@ CREATE TABLE IF NOT EXISTS tasks (
 );
 """
 
+_INSERT_TASK_SQL = """
+INSERT INTO tasks
+  (id, status, progress, model, type, mode, prompt, negative_prompt,
+   parameters, width, height, seed, created_at, updated_at)
+VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
 _CREATE_IDX_SQL = """
 CREATE INDEX IF NOT EXISTS idx_tasks_status   ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_tasks_model    ON tasks(model);
@@ -48,6 +58,17 @@ CREATE INDEX IF NOT EXISTS idx_tasks_created  ON tasks(created_at DESC);
 """
 
 
+logger = logging.getLogger("storage")
+
+# Background WAL checkpoint cadence (seconds) and -wal size cap (bytes).
+CHECKPOINT_INTERVAL = 60.0
+JOURNAL_SIZE_LIMIT = 64 * 1024 * 1024
+
+# Set once init_db() has created the schema; lets request handlers skip a
+# per-call os.path.exists(DB_PATH) stat.
+DB_READY = False
+
+
 # ─── Connection helper ────────────────────────────────────────────────────────
 
 @contextmanager
@@ -59,6 +80,8 @@ def _db() -> Generator[sqlite3.Connection, None, None]:
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    # Per-connection setting, so it is applied on every open.
+    conn.execute(f"PRAGMA journal_size_limit={JOURNAL_SIZE_LIMIT}")
     try:
         yield conn
         conn.commit()
@@ -71,8 +94,67 @@ def _db() -> Generator[sqlite3.Connection, None, None]:
 
 def init_db() -> None:
     """Create tables and indexes if they don't exist. Call on startup."""
+    global DB_READY
     with _db() as conn:
         conn.executescript(_CREATE_TASKS_SQL + _CREATE_IDX_SQL)
+    DB_READY = True
+
+
+# ─── WAL maintenance ──────────────────────────────────────────────────────────
+
+_checkpoint_thread: Optional[threading.Thread] = None
+_checkpoint_stop = threading.Event()
+
+
+def checkpoint_wal() -> None:
+    """Fold the -wal file back into the main DB and truncate it."""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+
+
+def _checkpoint_loop(interval: float) -> None:
+    # Event.wait instead of time.sleep so stop_checkpoint_thread() returns
+    # immediately rather than after up to a full interval.
+    while not _checkpoint_stop.wait(interval):
+        try:
+            checkpoint_wal()
+        except Exception as exc:
+            logger.warning("WAL checkpoint failed: %s", exc)
+
+
+def start_checkpoint_thread(interval: float = CHECKPOINT_INTERVAL) -> threading.Thread:
+    """
+    Start (once per process) a daemon thread that periodically checkpoints
+    the WAL so request handlers don't pay for it during write bursts.
+    """
+    global _checkpoint_thread
+    if _checkpoint_thread is None or not _checkpoint_thread.is_alive():
+        _checkpoint_stop.clear()
+        _checkpoint_thread = threading.Thread(
+            target=_checkpoint_loop,
+            args=(interval,),
+            daemon=True,
+            name="wal-checkpoint",
+        )
+        _checkpoint_thread.start()
+    return _checkpoint_thread
+
+
+def stop_checkpoint_thread(timeout: float = 5.0) -> None:
+    """Wake and join the checkpoint thread, then run a final checkpoint."""
+    global _checkpoint_thread
+    _checkpoint_stop.set()
+    if _checkpoint_thread is not None:
+        _checkpoint_thread.join(timeout)
+        _checkpoint_thread = None
+    if DB_READY:
+        try:
+            checkpoint_wal()
+        except Exception as exc:
+            logger.warning("WAL checkpoint failed: %s", exc)
 
 
 # ─── Task CRUD ────────────────────────────────────────────────────────────────
@@ -81,6 +163,13 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=2048)
+def _parse_iso(value: str) -> datetime:
+    """Parse a stored ISO-8601 timestamp; memoized because status polling
+    re-reads the same created_at/updated_at strings over and over."""
+    return datetime.fromisoformat(value)
+
+
 def create_task(
     model: str,
     gen_type: str,
@@ -93,24 +182,38 @@ def create_task(
     seed: int,
 ) -> str:
     """Insert a new task row and return the generated task_id."""
-    task_id = str(uuid.uuid4())
+    return create_tasks_bulk([{
+        "model": model,
+        "gen_type": gen_type,
+        "mode": mode,
+        "prompt": prompt,
+        "negative_prompt": negative_prompt,
+        "parameters": parameters,
+        "width": width,
+        "height": height,
+        "seed": seed,
+    }])[0]
+
+
+def create_tasks_bulk(tasks: list[dict[str, Any]]) -> list[str]:
+    """
+    Insert several task rows in a single transaction and return their ids
+    in input order. Each dict takes the same keyword arguments as create_task().
+    """
     now = _now_iso()
-    with _db() as conn:
-        conn.execute(
-            """
-            INSERT INTO tasks
-              (id, status, progress, model, type, mode, prompt, negative_prompt,
-               parameters, width, height, seed, created_at, updated_at)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                task_id, "pending", 0, model, gen_type, mode,
-                prompt, negative_prompt,
-                json.dumps(parameters),
-                width, height, seed, now, now,
-            ),
+    task_ids = [str(uuid.uuid4()) for _ in tasks]
+    rows = [
+        (
+            task_id, "pending", 0, t["model"], t["gen_type"], t["mode"],
+            t["prompt"], t["negative_prompt"],
+            json.dumps(t["parameters"]),
+            t["width"], t["height"], t["seed"], now, now,
         )
-    return task_id
+        for task_id, t in zip(task_ids, tasks)
+    ]
+    with _db() as conn:
+        conn.executemany(_INSERT_TASK_SQL, rows)
+    return task_ids
 
 
 def update_task_status(
@@ -163,8 +266,8 @@ def get_task(task_id: str) -> Optional[StatusResponse]:
         result_url=f"{base_url}/results/{row['id']}" if row["result_path"] else None,
         preview_url=f"{base_url}/preview/{row['id']}" if row["preview_path"] else None,
         error=row["error_msg"],
-        created_at=datetime.fromisoformat(row["created_at"]),
-        updated_at=datetime.fromisoformat(row["updated_at"]),
+        created_at=_parse_iso(row["created_at"]),
+        updated_at=_parse_iso(row["updated_at"]),
     )
 
 
@@ -229,7 +332,7 @@ def list_gallery(
             width=row["width"],
             height=row["height"],
             seed=row["seed"],
-            created_at=datetime.fromisoformat(row["created_at"]),
+            created_at=_parse_iso(row["created_at"]),
             preview_url=f"{base_url}/preview/{row['id']}",
             result_url=f"{base_url}/results/{row['id']}",
         )
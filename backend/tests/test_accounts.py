@@ -77,6 +77,25 @@ class TestUpdateStatus:
         row = accounts.get_account(aid)
         assert row["last_error"] is None
 
+    def test_deployed_digest_kept_until_next_success(self):
+        aid = self._add()
+        accounts.update_account_status(aid, "ready", deployed_digest="abc")
+        accounts.update_account_status(aid, "pending")
+        assert accounts.get_account(aid)["deployed_digest"] == "abc"
+
+    def test_init_adds_digest_column_to_old_table(self):
+        with accounts._db() as conn:
+            conn.execute("DROP TABLE modal_accounts")
+            conn.execute(
+                "CREATE TABLE modal_accounts (id TEXT PRIMARY KEY, label TEXT NOT NULL,"
+                " token_id TEXT NOT NULL, token_secret TEXT NOT NULL, workspace TEXT,"
+                " status TEXT NOT NULL DEFAULT 'pending', added_at TEXT NOT NULL,"
+                " last_used TEXT, last_error TEXT, use_count INTEGER NOT NULL DEFAULT 0)"
+            )
+        accounts.init_accounts_table()
+        aid = self._add()
+        assert accounts.get_account(aid)["deployed_digest"] is None
+
 
 class TestMarkUsed:
     def test_increments_use_count(self):
@@ -125,6 +144,25 @@ class TestListReadyAccounts:
         assert accounts.list_ready_accounts() == []
 
 
+    def test_reflects_writes_after_cached_read(self):
+        aid = accounts.add_account("C", "t", "s")
+        accounts.update_account_status(aid, "ready")
+        assert [r["id"] for r in accounts.list_ready_accounts()] == [aid]
+        accounts.disable_account(aid)
+        assert accounts.list_ready_accounts() == []
+
+    def test_repeated_reads_served_from_cache(self, monkeypatch):
+        aid = accounts.add_account("C", "t", "s")
+        accounts.update_account_status(aid, "ready")
+        accounts.list_ready_accounts()
+
+        def _fail():
+            raise AssertionError("unexpected DB read")
+
+        monkeypatch.setattr(accounts, "_db", _fail)
+        assert accounts.list_ready_accounts()[0]["id"] == aid
+
+
 class TestDeleteAccount:
     def test_deletes_existing(self):
         aid = accounts.add_account("Del", "t", "s")
@@ -150,3 +188,25 @@ class TestDisableEnable:
         accounts.enable_account(aid)
         row = accounts.get_account(aid)
         assert row["status"] == "ready"
+
+
+class TestAccountsVersion:
+    def test_bumped_on_add(self):
+        before = accounts.accounts_version()
+        accounts.add_account("V", "t", "s")
+        assert accounts.accounts_version() > before
+
+    def test_bumped_on_status_change_and_delete(self):
+        aid = accounts.add_account("V", "t", "s")
+        v1 = accounts.accounts_version()
+        accounts.update_account_status(aid, "ready")
+        v2 = accounts.accounts_version()
+        accounts.delete_account(aid)
+        assert v1 < v2 < accounts.accounts_version()
+
+    def test_unchanged_by_reads(self):
+        accounts.add_account("V", "t", "s")
+        before = accounts.accounts_version()
+        accounts.list_accounts()
+        accounts.list_ready_accounts()
+        assert accounts.accounts_version() == before
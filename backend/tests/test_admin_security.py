@@ -0,0 +1,61 @@
+"""
+Unit tests for backend/admin_security.py
+Uses a temporary SQLite database — no Modal, no GPU.
+"""
+import sqlite3
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+BACKEND = str(Path(__file__).parent.parent)
+if BACKEND not in sys.path:
+    sys.path.insert(0, BACKEND)
+
+import admin_security  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(tmp_path, monkeypatch):
+    db_file = str(tmp_path / "audit.db")
+    monkeypatch.setattr(admin_security, "_get_db_path", lambda: db_file)
+    admin_security._ensure_audit_table()
+    yield db_file
+    admin_security.flush_audit_log()
+
+
+def _rows(db_file):
+    conn = sqlite3.connect(db_file)
+    try:
+        return conn.execute(
+            "SELECT ip, action, details, success FROM admin_audit_log ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+class TestAuditLog:
+    def test_flush_makes_rows_visible(self, tmp_db):
+        admin_security._log_action("1.2.3.4", "list_accounts")
+        admin_security._log_action("1.2.3.4", "deploy", "bad_key_attempt", success=False)
+        admin_security.flush_audit_log()
+        assert _rows(tmp_db) == [
+            ("1.2.3.4", "list_accounts", "", 1),
+            ("1.2.3.4", "deploy", "bad_key_attempt", 0),
+        ]
+
+    def test_burst_is_written_in_batches(self, tmp_db, monkeypatch):
+        monkeypatch.setattr(admin_security, "AUDIT_FLUSH_INTERVAL", 0.5)
+        real_write = admin_security._write_audit_rows
+        with patch("admin_security._write_audit_rows", side_effect=real_write) as write:
+            for i in range(20):
+                admin_security._log_action("ip", f"action-{i}")
+            admin_security.flush_audit_log()
+        assert write.call_count < 20
+        assert len(_rows(tmp_db)) == 20
+
+    def test_write_failure_does_not_block_flush(self, monkeypatch):
+        monkeypatch.setattr(admin_security, "_get_db_path", lambda: "/nonexistent/dir/x.db")
+        admin_security._log_action("ip", "health")
+        admin_security.flush_audit_log()
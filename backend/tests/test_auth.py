@@ -115,3 +115,39 @@ class TestVerifyApiKey:
         # Both should still be importable without crash
         assert callable(auth_nonempty.verify_api_key)
         assert callable(auth_empty.verify_api_key)
+
+
+class TestAuthState:
+    def _fresh_auth(self, key: str):
+        os.environ["API_KEY"] = key
+        if "auth" in sys.modules:
+            del sys.modules["auth"]
+        import auth
+        return auth
+
+    def test_valid_key_accepted(self):
+        auth = self._fresh_auth("secret-key")
+        assert auth.verify_api_key(header_key="secret-key", query_key=None) == "secret-key"
+
+    def test_query_key_accepted(self):
+        auth = self._fresh_auth("secret-key")
+        assert auth.verify_api_key(header_key=None, query_key="secret-key") == "secret-key"
+
+    def test_wrong_key_rejected(self):
+        from fastapi import HTTPException
+        auth = self._fresh_auth("secret-key")
+        with pytest.raises(HTTPException) as exc:
+            auth.verify_api_key(header_key="nope", query_key=None)
+        assert exc.value.status_code == 403
+
+    def test_auth_state_is_fixed_until_reset(self):
+        auth = self._fresh_auth("first")
+        os.environ["API_KEY"] = "second"
+        assert auth._AUTH_STATE.expected_bytes == b"first"
+        auth._reset_auth_state()
+        assert auth._AUTH_STATE.expected_bytes == b"second"
+
+    def test_unset_key_fails_open(self):
+        auth = self._fresh_auth("")
+        assert auth._AUTH_STATE.configured is False
+        assert auth.verify_api_key(header_key=None, query_key=None) == ""
@@ -3,6 +3,7 @@ Unit tests for backend/models/base.py
 Tests helper methods on BasePipeline — no GPU, no Modal, no network.
 """
 import base64
+import contextlib
 import io
 import os
 import sys
@@ -119,3 +120,90 @@ class TestMakePreviewFromPil:
         loaded = Image.open(save_path)
         assert loaded.width <= 512
         assert loaded.height <= 512
+
+
+class TestCompileDenoiser:
+    class _Block:
+        def __init__(self):
+            self.compiled = False
+
+        def compile(self):
+            self.compiled = True
+
+    @pytest.fixture(autouse=True)
+    def fake_dynamo(self, monkeypatch):
+        """Stand-in torch._dynamo so the helper runs without torch installed."""
+        import types
+        torch_mod = types.ModuleType("torch")
+        dynamo = types.ModuleType("torch._dynamo")
+        config = types.SimpleNamespace(suppress_errors=False)
+
+        @contextlib.contextmanager
+        def patch(**changes):
+            saved = {k: getattr(config, k) for k in changes}
+            for k, v in changes.items():
+                setattr(config, k, v)
+            try:
+                yield
+            finally:
+                for k, v in saved.items():
+                    setattr(config, k, v)
+
+        config.patch = patch
+        dynamo.config = config
+        torch_mod._dynamo = dynamo
+        monkeypatch.setitem(sys.modules, "torch", torch_mod)
+        monkeypatch.setitem(sys.modules, "torch._dynamo", dynamo)
+        return dynamo
+
+    def _pipe(self, **block_lists):
+        from types import SimpleNamespace
+        return SimpleNamespace(transformer=SimpleNamespace(**block_lists))
+
+    def test_compiles_flux_block_lists(self):
+        double, single = [self._Block()], [self._Block(), self._Block()]
+        BasePipeline.compile_denoiser(
+            self._pipe(transformer_blocks=double, single_transformer_blocks=single)
+        )
+        assert all(b.compiled for b in double + single)
+
+    def test_compiles_wan_blocks(self):
+        blocks = [self._Block() for _ in range(3)]
+        BasePipeline.compile_denoiser(self._pipe(blocks=blocks))
+        assert all(b.compiled for b in blocks)
+
+    def test_pipeline_without_transformer_is_noop(self):
+        from types import SimpleNamespace
+        BasePipeline.compile_denoiser(SimpleNamespace(unet=object()))
+
+    def _pipeline(self, compile_transformer):
+        class _Pipeline(BasePipeline):
+            def load(self, cache_path):
+                pass
+
+            def generate(self, request, task_id, results_path):
+                pass
+
+        pipeline = _Pipeline()
+        pipeline.compile_transformer = compile_transformer
+        return pipeline
+
+    def test_leaves_global_dynamo_config_alone(self, fake_dynamo):
+        BasePipeline.compile_denoiser(self._pipe(blocks=[self._Block()]))
+        assert fake_dynamo.config.suppress_errors is False
+
+    def test_eager_fallback_scoped_to_call(self, fake_dynamo):
+        with self._pipeline(compile_transformer=True).eager_fallback():
+            assert fake_dynamo.config.suppress_errors is True
+        assert fake_dynamo.config.suppress_errors is False
+
+    def test_eager_fallback_noop_without_compile(self, fake_dynamo):
+        with self._pipeline(compile_transformer=False).eager_fallback():
+            assert fake_dynamo.config.suppress_errors is False
+
+    def test_compile_error_leaves_pipeline_usable(self):
+        class _Broken:
+            def compile(self):
+                raise RuntimeError("no inductor")
+
+        BasePipeline.compile_denoiser(self._pipe(blocks=[_Broken()]))
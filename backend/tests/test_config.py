@@ -167,3 +167,41 @@ class TestModelsSchema:
         import config
         phr00t = next(m for m in config.MODELS_SCHEMA if m["id"] == "phr00t")
         assert "arbitrary_frame" not in phr00t["modes"]
+
+    def test_models_schema_json_matches_schema(self):
+        import json
+        import config
+        assert json.loads(config.MODELS_SCHEMA_JSON) == {"models": config.MODELS_SCHEMA}
+
+
+class TestSettings:
+    def test_module_constants_mirror_settings(self):
+        import config
+        s = config.SETTINGS
+        assert config.VIDEO_GPU == s.video_gpu
+        assert config.IMAGE_TIMEOUT == s.image_timeout
+        assert config.MODEL_IDS is s.model_ids
+
+    def test_settings_are_frozen(self):
+        import dataclasses
+        import config
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.SETTINGS.video_gpu = "H100"
+
+    def test_model_ids_are_read_only(self):
+        import config
+        with pytest.raises(TypeError):
+            config.MODEL_IDS["flux"] = "someone/else"
+
+    def test_env_override_deploy_concurrency(self):
+        cfg = _reload_config({"DEPLOY_CONCURRENCY": "8"})
+        assert cfg.SETTINGS.deploy_concurrency == 8
+        assert cfg.DEPLOY_CONCURRENCY == 8
+
+    def test_torch_compile_defaults_off(self):
+        cfg = _reload_config({})
+        assert cfg.TORCH_COMPILE is False
+
+    def test_env_override_torch_compile(self):
+        cfg = _reload_config({"TORCH_COMPILE": "1"})
+        assert cfg.TORCH_COMPILE is True
@@ -0,0 +1,334 @@
+"""
+Unit tests for backend/deployer.py
+The `modal deploy` subprocess is never spawned — deploy_account is patched.
+"""
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+BACKEND = str(Path(__file__).parent.parent)
+if BACKEND not in sys.path:
+    sys.path.insert(0, BACKEND)
+
+import deployer  # noqa: E402
+
+
+def _account(id_: str, status: str) -> dict:
+    return {"id": id_, "status": status}
+
+
+class TestDeployAllAccounts:
+    def test_skips_disabled_accounts(self):
+        rows = [
+            _account("a", "ready"),
+            _account("b", "disabled"),
+            _account("c", "failed"),
+        ]
+        deployed = []
+        with patch("deployer.acc_store.list_accounts", return_value=rows), \
+             patch("deployer.deploy_account", side_effect=lambda id_, force: deployed.append((id_, force))):
+            futures = deployer.deploy_all_accounts()
+            for f in futures:
+                f.result(timeout=5)
+        assert len(futures) == 2
+        assert sorted(deployed) == [("a", True), ("c", True)]
+
+    def test_unforced_skips_up_to_date_ready_accounts(self):
+        digest = deployer._deploy_digest()
+        rows = [
+            {"id": "a", "status": "ready", "deployed_digest": digest},
+            {"id": "b", "status": "ready", "deployed_digest": "stale"},
+            {"id": "c", "status": "failed", "deployed_digest": digest},
+        ]
+        deployed = []
+        with patch("deployer.acc_store.list_accounts", return_value=rows), \
+             patch("deployer.deploy_account", side_effect=lambda id_, force: deployed.append((id_, force))):
+            futures = deployer.deploy_all_accounts(force=False)
+            for f in futures:
+                f.result(timeout=5)
+        assert len(futures) == 2
+        assert sorted(deployed) == [("b", False), ("c", False)]
+
+    def test_unforced_digest_failure_queues_everything(self):
+        rows = [{"id": "a", "status": "ready", "deployed_digest": "x"}]
+        with patch("deployer.acc_store.list_accounts", return_value=rows), \
+             patch("deployer._deploy_digest", side_effect=FileNotFoundError("gone")), \
+             patch("deployer.deploy_account", return_value=None):
+            futures = deployer.deploy_all_accounts(force=False)
+            for f in futures:
+                f.result(timeout=5)
+        assert len(futures) == 1
+
+    def test_returns_empty_list_without_accounts(self):
+        with patch("deployer.acc_store.list_accounts", return_value=[]):
+            assert deployer.deploy_all_accounts() == []
+
+
+class TestDeployAccountAsync:
+    def test_returns_future_with_result(self):
+        with patch("deployer.deploy_account", return_value=None) as fn:
+            future = deployer.deploy_account_async("acc-1")
+            assert future.result(timeout=5) is None
+        fn.assert_called_once_with("acc-1", True)
+
+    def test_concurrent_calls_share_inflight_future(self):
+        release = threading.Event()
+        with patch("deployer.deploy_account", side_effect=lambda *a: release.wait(5)) as fn:
+            first = deployer.deploy_account_async("acc-1")
+            second = deployer.deploy_account_async("acc-1")
+            release.set()
+            first.result(timeout=5)
+        assert first is second
+        assert fn.call_count == 1
+
+    def test_forced_call_after_unforced_inflight_runs_forced(self):
+        release = threading.Event()
+        calls = []
+
+        def _deploy(account_id, force):
+            calls.append((account_id, force))
+            release.wait(5)
+
+        with patch("deployer.deploy_account", side_effect=_deploy):
+            unforced = deployer.deploy_account_async("acc-1", force=False)
+            forced = deployer.deploy_account_async("acc-1", force=True)
+            again = deployer.deploy_account_async("acc-1", force=True)
+            release.set()
+            forced.result(timeout=5)
+        assert forced is not unforced
+        assert again is forced
+        assert calls == [("acc-1", False), ("acc-1", True)]
+
+    def test_unforced_call_reuses_forced_inflight(self):
+        release = threading.Event()
+        with patch("deployer.deploy_account", side_effect=lambda *a: release.wait(5)) as fn:
+            forced = deployer.deploy_account_async("acc-1", force=True)
+            unforced = deployer.deploy_account_async("acc-1", force=False)
+            release.set()
+            forced.result(timeout=5)
+        assert unforced is forced
+        assert fn.call_count == 1
+
+    def test_new_call_after_completion_redeploys(self):
+        with patch("deployer.deploy_account", return_value=None) as fn:
+            deployer.deploy_account_async("acc-1").result(timeout=5)
+            deployer.deploy_account_async("acc-1").result(timeout=5)
+        assert fn.call_count == 2
+
+
+class TestShutdownDeploys:
+    @pytest.fixture(autouse=True)
+    def _fresh_inflight(self, monkeypatch):
+        monkeypatch.setattr(deployer, "_INFLIGHT", {})
+
+    def test_cancels_queued_but_not_running(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(deployer, "_DEPLOY_POOL", pool)
+        release = threading.Event()
+        started = threading.Event()
+
+        def _deploy(account_id, force):
+            started.set()
+            release.wait(5)
+
+        with patch("deployer.deploy_account", side_effect=_deploy), \
+             patch("deployer.acc_store.get_account", return_value=None):
+            running = deployer.deploy_account_async("a")
+            queued = deployer.deploy_account_async("b")
+            started.wait(5)
+            deployer.shutdown_deploys()
+            release.set()
+            running.result(timeout=5)
+        assert queued.cancelled()
+        assert not running.cancelled()
+
+    def test_without_cancel_queued_deploys_still_run(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+        monkeypatch.setattr(deployer, "_DEPLOY_POOL", ThreadPoolExecutor(max_workers=1))
+        release = threading.Event()
+        with patch("deployer.deploy_account", side_effect=lambda *a: release.wait(5)):
+            running = deployer.deploy_account_async("a")
+            queued = deployer.deploy_account_async("b")
+            deployer.shutdown_deploys(cancel_futures=False)
+            release.set()
+            queued.result(timeout=5)
+        assert running.done() and not queued.cancelled()
+
+    def test_marks_cancelled_pending_accounts_failed(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+        monkeypatch.setattr(deployer, "_DEPLOY_POOL", ThreadPoolExecutor(max_workers=1))
+        release = threading.Event()
+        started = threading.Event()
+        statuses = {"a": "pending", "b": "pending", "c": "ready"}
+
+        def _deploy(account_id, force):
+            started.set()
+            release.wait(5)
+
+        with patch("deployer.deploy_account", side_effect=_deploy), \
+             patch("deployer.acc_store.get_account",
+                   side_effect=lambda id_: {"id": id_, "status": statuses[id_]}), \
+             patch("deployer.acc_store.update_account_status") as update:
+            running = deployer.deploy_account_async("a")
+            deployer.deploy_account_async("b")
+            deployer.deploy_account_async("c")
+            started.wait(5)
+            deployer.shutdown_deploys()
+            release.set()
+            running.result(timeout=5)
+        update.assert_called_once_with("b", "failed", error="Deploy cancelled on shutdown")
+
+
+class TestExtractWorkspace:
+    def test_extracts_workspace_from_api_url(self):
+        out = "Building...\n✓ Created web function fastapi_app => https://my-team--gooni-api.modal.run\n"
+        assert deployer._extract_workspace(out) == "my-team"
+
+    def test_first_url_wins(self):
+        out = (
+            "✓ Created web function health => https://ws1--gooni-api-health.modal.run\n"
+            "✓ Created web function fastapi_app => https://ws1--gooni-api.modal.run\n"
+        )
+        assert deployer._extract_workspace(out) == "ws1"
+
+    def test_returns_none_without_url(self):
+        assert deployer._extract_workspace("✓ App deployed!\nView at https://modal.com/apps") is None
+
+    def test_empty_output(self):
+        assert deployer._extract_workspace("") is None
+
+
+class TestRunModalDeploy:
+    def _fake_deploy(self, monkeypatch, script: str):
+        real_popen = subprocess.Popen
+
+        def _popen(cmd, **kwargs):
+            return real_popen([sys.executable, "-c", script], **kwargs)
+
+        monkeypatch.setattr(deployer.subprocess, "Popen", _popen)
+
+    def test_success_picks_workspace_from_stream(self, monkeypatch):
+        self._fake_deploy(monkeypatch, (
+            "print('Building image...')\n"
+            "print('=> https://team-x--gooni-api.modal.run')\n"
+            "print('App deployed!')\n"
+        ))
+        returncode, workspace, tail = deployer._run_modal_deploy({})
+        assert returncode == 0
+        assert workspace == "team-x"
+        assert tail.endswith("App deployed!\n")
+
+    def test_failure_keeps_only_tail(self, monkeypatch):
+        monkeypatch.setattr(deployer, "DEPLOY_LOG_TAIL_LINES", 3)
+        self._fake_deploy(monkeypatch, (
+            "import sys\n"
+            "for i in range(10): print(f'line {i}', flush=True)\n"
+            "print('boom', file=sys.stderr)\n"
+            "sys.exit(1)\n"
+        ))
+        returncode, workspace, tail = deployer._run_modal_deploy({})
+        assert returncode == 1
+        assert workspace is None
+        assert tail.splitlines() == ["line 8", "line 9", "boom"]
+
+    def test_timeout_kills_process(self, monkeypatch):
+        monkeypatch.setattr(deployer, "DEPLOY_TIMEOUT", 0.2)
+        self._fake_deploy(monkeypatch, "import time\ntime.sleep(30)\n")
+        with pytest.raises(subprocess.TimeoutExpired):
+            deployer._run_modal_deploy({})
+
+
+class TestDeployAccount:
+    def _run(self, account: dict, force: bool = True):
+        with patch("deployer.acc_store.get_account", return_value=account), \
+             patch("deployer.acc_store.update_account_status") as update, \
+             patch("deployer._run_modal_deploy", return_value=(0, "ws", "")):
+            deployer.deploy_account(account["id"], force=force)
+        return [c.args[1] for c in update.call_args_list]
+
+    def _ready(self, digest):
+        return {"id": "a", "status": "ready", "last_error": None,
+                "token_id": "t", "token_secret": "s", "deployed_digest": digest}
+
+    def test_unforced_skips_when_digest_matches(self):
+        assert self._run(self._ready(deployer._deploy_digest()), force=False) == []
+
+    def test_unforced_deploys_when_digest_differs(self):
+        assert self._run(self._ready("stale"), force=False) == ["pending", "ready"]
+
+    def test_forced_deploys_even_when_digest_matches(self):
+        assert self._run(self._ready(deployer._deploy_digest())) == ["pending", "ready"]
+
+    def test_success_records_digest(self):
+        account = self._ready(None)
+        with patch("deployer.acc_store.get_account", return_value=account), \
+             patch("deployer.acc_store.update_account_status") as update, \
+             patch("deployer._run_modal_deploy", return_value=(0, "ws", "")):
+            deployer.deploy_account("a")
+        assert update.call_args.kwargs["deployed_digest"] == deployer._deploy_digest()
+
+    @pytest.mark.parametrize("force", [True, False])
+    def test_digest_failure_still_deploys(self, force):
+        account = self._ready("old")
+        with patch("deployer.acc_store.get_account", return_value=account), \
+             patch("deployer.acc_store.update_account_status") as update, \
+             patch("deployer._deploy_digest", side_effect=OSError("unreadable")), \
+             patch("deployer._run_modal_deploy", return_value=(0, "ws", "")) as run:
+            deployer.deploy_account("a", force=force)
+        run.assert_called_once()
+        assert update.call_args.args[1] == "ready"
+        assert update.call_args.kwargs["deployed_digest"] is None
+
+    def test_digest_skips_dangling_and_non_package_files(self, tmp_path, monkeypatch):
+        (tmp_path / "app.py").write_text("x = 1\n")
+        (tmp_path / "models").mkdir()
+        (tmp_path / "models" / "flux.py").write_text("y = 2\n")
+        (tmp_path / "gone.py").symlink_to(tmp_path / "missing.py")
+        (tmp_path / "other").mkdir()
+        (tmp_path / "other" / "unrelated.py").write_text("z = 3\n")
+        monkeypatch.setattr(deployer, "BACKEND_DIR", tmp_path)
+        monkeypatch.setattr(deployer, "_digest_cache", None)
+
+        files = [p.relative_to(tmp_path).as_posix() for p, _ in deployer._source_files()]
+        assert files == ["app.py", "models/flux.py"]
+        assert deployer._deploy_digest() == deployer._deploy_digest()
+
+    def test_digest_tracks_deploy_env(self, monkeypatch):
+        monkeypatch.setenv("VIDEO_GPU", "A100")
+        before = deployer._deploy_digest()
+        monkeypatch.setenv("VIDEO_GPU", "H100")
+        assert deployer._deploy_digest() != before
+
+    def test_new_pending_account_skips_pending_write(self):
+        statuses = self._run({"id": "a", "status": "pending", "last_error": None,
+                              "token_id": "t", "token_secret": "s"})
+        assert statuses == ["ready"]
+
+    def test_redeploy_resets_to_pending_first(self):
+        statuses = self._run({"id": "a", "status": "failed", "last_error": "boom",
+                              "token_id": "t", "token_secret": "s"})
+        assert statuses == ["pending", "ready"]
+
+    def test_child_env_has_credentials_and_overrides(self, monkeypatch):
+        monkeypatch.setenv("MODAL_PROFILE", "someone-else")
+        seen = {}
+
+        def _capture(env):
+            seen.update(env)
+            return 0, "ws", ""
+
+        account = {"id": "a", "status": "ready", "last_error": None,
+                   "token_id": "tid", "token_secret": "tsec"}
+        with patch("deployer.acc_store.get_account", return_value=account), \
+             patch("deployer.acc_store.update_account_status"), \
+             patch("deployer._run_modal_deploy", side_effect=_capture):
+            deployer.deploy_account("a")
+        assert seen["MODAL_TOKEN_ID"] == "tid"
+        assert seen["MODAL_TOKEN_SECRET"] == "tsec"
+        assert seen["PYTHONIOENCODING"] == "utf-8"
+        assert "MODAL_PROFILE" not in seen
@@ -4,6 +4,7 @@ Uses a temporary SQLite database — no GPU, no Modal, no real files.
 """
 import os
 import sys
+import time
 import tempfile
 from pathlib import Path
 
@@ -68,6 +69,25 @@ class TestCreateTask:
         assert result.task_id == task_id
 
 
+class TestCreateTasksBulk:
+    def _spec(self, prompt):
+        return {
+            "model": "pony", "gen_type": "image", "mode": "txt2img",
+            "prompt": prompt, "negative_prompt": "", "parameters": {"steps": 30},
+            "width": 512, "height": 512, "seed": -1,
+        }
+
+    def test_returns_ids_in_order(self):
+        ids = storage.create_tasks_bulk([self._spec("a"), self._spec("b"), self._spec("c")])
+        assert len(ids) == 3
+        assert len(set(ids)) == 3
+        for tid in ids:
+            assert storage.get_task(tid).status.value == "pending"
+
+    def test_empty_batch(self):
+        assert storage.create_tasks_bulk([]) == []
+
+
 # ─── update_task_status ───────────────────────────────────────────────────────
 
 class TestUpdateTaskStatus:
@@ -216,3 +236,29 @@ class TestDeleteGalleryItem:
     def test_delete_nonexistent_task(self):
         deleted = storage.delete_gallery_item("does-not-exist")
         assert deleted is False
+
+
+# ─── init_db ──────────────────────────────────────────────────────────────────
+
+class TestInitDb:
+    def test_sets_db_ready(self, monkeypatch):
+        monkeypatch.setattr(storage, "DB_READY", False)
+        storage.init_db()
+        assert storage.DB_READY is True
+
+    def test_checkpoint_wal_truncates_wal_file(self, tmp_db):
+        storage.create_task(
+            model="pony", gen_type="image", mode="txt2img",
+            prompt="wal", negative_prompt="", parameters={},
+            width=512, height=512, seed=0,
+        )
+        storage.checkpoint_wal()
+        wal = Path(storage.DB_PATH + "-wal")
+        assert not wal.exists() or wal.stat().st_size == 0
+
+    def test_stop_checkpoint_thread_returns_promptly(self, tmp_db):
+        thread = storage.start_checkpoint_thread(interval=3600)
+        started = time.monotonic()
+        storage.stop_checkpoint_thread()
+        assert time.monotonic() - started < 2
+        assert not thread.is_alive()